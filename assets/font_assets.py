@@ -18,7 +18,6 @@ class FontAssets:
     """
 
     def __init__(self, screen_size: tuple[int, int]) -> None:
-        pygame.init()
         base_font_size = screen_size[1] / 30  # Scale font size based on screen height
         pixel_font_path = os.path.join(os.getcwd(), "assets", "fonts", "Grand9K Pixel.ttf")
         self._load_fonts(base_font_size, pixel_font_path)
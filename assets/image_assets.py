@@ -2,8 +2,9 @@
 
 This module defines an ImageAssets class that loads and manages image assets for the game.
 The class includes methods for loading static images and animated images, as well as providing
-access to these images by name. The images are loaded from a specified directory and can be
-used for rendering graphics, backgrounds, and other visual elements in the game.
+access to these images by name. The images are loaded from a specified directory when they are
+first requested and can be used for rendering graphics, backgrounds, and other visual elements in
+the game.
 """
 
 import os
@@ -12,16 +13,31 @@ import pygame
 
 
 class ImageAssets:
-    """Class to manage image assets for the game."""
+    """Class to manage image assets for the game.
+
+    Images are only loaded when they are first requested, so screens that do not use them do not
+    pay for loading them. Loaded surfaces are shared between all instances, so recreating the
+    assets after a screen mode change does not read and decode the image files again.
+    """
+
+    loaded_images: dict[str, pygame.Surface] = {}
+    loaded_animations: dict[str, list[pygame.Surface]] = {}
+
+    static_image_files: dict[str, str] = {
+        "reactor_background": "reactor_background.png",
+        "shop_computer_image": "computer_dark.png",
+        "item_box": "item_box_dark.png",
+    }
+    animation_folders: dict[str, tuple[str, int]] = {
+        "reactor_liquid": ("liquid", 31),
+        "reactor_stirrer": ("stirrer", 3),
+    }
 
     def __init__(self, screen_size: tuple[int, int]) -> None:
-        pygame.init()
         self.screen_size = screen_size
-        self.static_images = self._load_static_images()
-        self.animated_images = self._load_animated_images()
 
     def get_image(self, image_name: str) -> pygame.Surface:
-        """Get a static image by name.
+        """Get a static image by name, loading it on first use.
 
         Args:
             image_name (str): The name of the image to retrieve.
@@ -30,16 +46,20 @@ class ImageAssets:
             pygame.Surface: The requested image surface.
 
         Raises:
-            ValueError: If the image is not found in the static images.
+            ValueError: If the image is not found in the static image files.
         """
 
-        image = self.static_images.get(image_name)
+        image = ImageAssets.loaded_images.get(image_name)
         if image is None:
-            raise ValueError(f"Image '{image_name}' not found in static images.")
+            filename = self.static_image_files.get(image_name)
+            if filename is None:
+                raise ValueError(f"Image '{image_name}' not found in static images.")
+            image = self._load_image(filename)
+            ImageAssets.loaded_images[image_name] = image
         return image
 
     def get_animation_frames(self, animation_name: str) -> list[pygame.Surface]:
-        """Get animation frames by name.
+        """Get animation frames by name, loading them on first use.
 
         Args:
             animation_name (str): The name of the animation to retrieve.
@@ -48,12 +68,16 @@ class ImageAssets:
             list[pygame.Surface]: A list of frames for the requested animation.
 
         Raises:
-            ValueError: If the animation is not found in the animated images.
+            ValueError: If the animation is not found in the animation folders.
         """
 
-        frames = self.animated_images.get(animation_name)
+        frames = ImageAssets.loaded_animations.get(animation_name)
         if frames is None:
-            raise ValueError(f"Animation '{animation_name}' not found in animated images.")
+            animation_folder = self.animation_folders.get(animation_name)
+            if animation_folder is None:
+                raise ValueError(f"Animation '{animation_name}' not found in animated images.")
+            frames = self._load_animation_sequence(*animation_folder)
+            ImageAssets.loaded_animations[animation_name] = frames
         return frames
 
     def _load_image(self, filename: str) -> pygame.Surface:
@@ -62,28 +86,9 @@ class ImageAssets:
         path = os.path.join(os.getcwd(), "assets", "images", filename)
         return pygame.image.load(path).convert_alpha()
 
-    def _load_static_images(self) -> dict[str, pygame.Surface]:
-        """Load all static images used in the game."""
-
-        return {
-            "reactor_background": self._load_image("reactor_background.png"),
-            "shop_computer_image": self._load_image("computer_dark.png"),
-            "item_box": self._load_image("item_box_dark.png"),
-        }
-
-    def _load_animated_images(self) -> dict[str, list[pygame.Surface]]:
-        """Load all frame sequences for animated assets."""
-
-        return {
-            "reactor_liquid": self._load_animation_sequence("liquid", 31),
-            "reactor_stirrer": self._load_animation_sequence("stirrer", 3),
-        }
-
     def _load_animation_sequence(self, folder_name: str, frame_count: int) -> list[pygame.Surface]:
         """Helper to load animation frames from a folder."""
 
-        base_path = os.path.join(os.getcwd(), "assets", "images", folder_name)
         return [
-            pygame.image.load(os.path.join(base_path, f"{i + 1}.png")).convert_alpha()
-            for i in range(frame_count)
+            self._load_image(os.path.join(folder_name, f"{i + 1}.png")) for i in range(frame_count)
         ]
@@ -1,16 +1,19 @@
 """Core module for the Cell class.
 
 This module defines the Cell class, which represents a single cell in the game.
-It includes methods for initializing the cell, calculating its pixel position,
-updating its radius, and calculating a randomized energy value.
+It includes methods for initializing and resetting the cell, updating its radius, and
+calculating a randomized energy value.
 The Cell class is used to manage the cell's properties, such as its energy value,
 growth state, and visual representation on the screen.
 """
 
 import random
+from typing import TYPE_CHECKING
 
 from core_modules.game_state import GameState
-from core_modules.utils import calculate_pixel_from_axial
+
+if TYPE_CHECKING:
+    from core_modules.hexagon_tile import HexagonTile
 
 
 class Cell:
@@ -18,26 +21,67 @@ class Cell:
 
     Args:
         coordinate_axial (tuple[int, int]): The axial coordinates of the cell.
+        hexagon (HexagonTile): The hexagon tile the cell is on.
         game_state (GameState): The game state containing the current game parameters.
         hexagon_minimal_radius (int): The minimal radius of the hexagon.
-        screen_size (tuple[int, int]): The size of the screen.
-        center_offset (tuple[float, float], optional): Custom center point as fractions of screen
-            size. Defaults to (0.5, 0.5).
+        energy_variation_sample (float | None, optional): Precomputed uniform sample in [-1, 1]
+            for the energy variation. Defaults to None, drawing a new sample.
     """
 
+    __slots__ = (
+        "coordinate_axial",
+        "coordinate_pixel",
+        "hexagon",
+        "growth",
+        "energy_affinity",
+        "default_division_threshold",
+        "division_threshold",
+        "energy_value",
+        "energy_consumption_rate_maximum",
+        "radius",
+    )
+
     def __init__(
         self,
         coordinate_axial: tuple[int, int],
+        hexagon: "HexagonTile",
         game_state: GameState,
         hexagon_minimal_radius: int,
-        screen_size: tuple[int, int],
-        center_offset: tuple[float, float] = (0.5, 0.5),
+        *,
+        energy_variation_sample: float | None = None,
     ):
-        self.coordinate_axial = coordinate_axial
-        self.center_offset = center_offset
-        self.coordinate_pixel = self.calculate_pixel_position(
-            screen_size, hexagon_minimal_radius, coordinate_axial, center_offset
+        self.radius: int = 0  # Set from the energy value by update_radius
+        self.reset(
+            coordinate_axial,
+            hexagon,
+            game_state,
+            hexagon_minimal_radius,
+            energy_variation_sample=energy_variation_sample,
         )
+
+    def reset(
+        self,
+        coordinate_axial: tuple[int, int],
+        hexagon: "HexagonTile",
+        game_state: GameState,
+        hexagon_minimal_radius: int,
+        *,
+        energy_variation_sample: float | None = None,
+    ) -> None:
+        """Reset the cell to a newly created cell, allowing a cell instance to be reused.
+
+        Args:
+            coordinate_axial (tuple[int, int]): The axial coordinates of the cell.
+            hexagon (HexagonTile): The hexagon tile the cell is on.
+            game_state (GameState): The game state containing the current game parameters.
+            hexagon_minimal_radius (int): The minimal radius of the hexagon.
+            energy_variation_sample (float | None, optional): Precomputed uniform sample in
+                [-1, 1] for the energy variation. Defaults to None, drawing a new sample.
+        """
+
+        self.coordinate_axial = coordinate_axial
+        self.hexagon = hexagon  # Kept to update the hexagon without a grid lookup
+        self.coordinate_pixel = hexagon.coordinate_pixel
         self.growth = True
 
         self.energy_affinity = game_state.cell_energy_affinity
@@ -45,7 +89,9 @@ class Cell:
         self.division_threshold = game_state.cell_division_threshold
         self.energy_value = min(
             self._calculate_randomized_energy_value(
-                game_state.cell_energy_initial, game_state.cell_energy_variation
+                game_state.cell_energy_initial,
+                game_state.cell_energy_variation,
+                energy_variation_sample,
             ),
             self.division_threshold,
         )
@@ -55,52 +101,36 @@ class Cell:
     def update_radius(self, hexagon_minimal_radius: int) -> None:
         """Update the cell's visual state parameters.
 
-        Args:
-            hexagon_minimal_radius (int): The minimal radius of the hexagon.
-        """
-
-        radius_factor = self.energy_value / self.default_division_threshold
-        self.radius = hexagon_minimal_radius * radius_factor
-
-    def calculate_pixel_position(
-        self,
-        screen_size: tuple[int, int],
-        hexagon_minimal_radius: int,
-        coordinate_axial: tuple[int, int],
-        center_offset: tuple[float, float] = (0.5, 0.5),
-    ) -> tuple[int, int]:
-        """Calculate the pixel position of the cell based on its axial coordinates.
+        The radius is truncated to whole pixels here, as cells are drawn in whole pixels.
 
         Args:
-            screen_size (tuple[int, int]): The size of the screen.
             hexagon_minimal_radius (int): The minimal radius of the hexagon.
-            coordinate_axial (tuple[int, int]): The axial coordinates of the cell.
-            center_offset (tuple[float, float], optional): Custom center point as fractions of
-                screen size. Defaults to (0.5, 0.5).
-
-        Returns:
-            tuple[int, int]: The pixel position of the cell on the screen.
         """
 
-        offset = calculate_pixel_from_axial((0, 0), hexagon_minimal_radius, coordinate_axial)
-
-        return (
-            round(screen_size[0] * center_offset[0]) + offset[0],
-            round(screen_size[1] * center_offset[1]) + offset[1],
+        self.radius = int(
+            hexagon_minimal_radius * self.energy_value / self.default_division_threshold
         )
 
     def _calculate_randomized_energy_value(
-        self, initial_energy_value: float, energy_variation: float
+        self,
+        initial_energy_value: float,
+        energy_variation: float,
+        energy_variation_sample: float | None = None,
     ) -> float:
         """Calculate a randomized energy value based on the initial value and variation.
 
         Args:
             initial_energy_value (float): The initial energy value.
             energy_variation (float): The variation factor for the energy value.
+            energy_variation_sample (float | None, optional): Precomputed uniform sample in
+                [-1, 1]. Defaults to None, drawing a new sample.
 
         Returns:
             float: The randomized energy value."""
 
-        energy_value = initial_energy_value * (1 + energy_variation * random.uniform(-1, 1))
+        if energy_variation_sample is None:
+            energy_variation_sample = random.uniform(-1, 1)
+
+        energy_value = initial_energy_value * (1 + energy_variation * energy_variation_sample)
 
         return energy_value
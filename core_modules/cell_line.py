@@ -2,8 +2,9 @@
 
 This module contains the CellLine class, which is responsible for creating and managing a line of
 cells in a hexagonal grid. The class includes methods for replicating cells, calculating biomass,
-and generating random positions for cells based on a Gaussian distribution. It also includes
-methods for scaling energy consumption rates and calculating Gaussian probabilities.
+reusing released cells, and generating random positions for cells based on a Gaussian distribution.
+It also includes methods for scaling energy consumption rates and calculating Gaussian
+probabilities.
 """
 
 import random
@@ -13,8 +14,9 @@ import numpy
 from core_modules.cell import Cell
 from core_modules.game_state import GameState
 from core_modules.hexagon_grid import HexagonGrid
-from core_modules.hexagon_tile import HexagonTile
-from core_modules.utils import calculate_axial_distance, calculate_hexagon_neighbors
+
+GAUSSIAN_SIGMA = 0.25  # standard deviation of the initial cell positions in hexagon tiles
+GAUSSIAN_EXPONENT_FACTOR = -1 / (2 * GAUSSIAN_SIGMA**2)
 
 
 class CellLine:
@@ -23,60 +25,54 @@ class CellLine:
     Args:
         hexagon_grid (HexagonGrid): The hexagonal grid containing the cells.
         game_state (GameState): The game state containing the current game parameters.
-        screen_size (tuple[int, int]): The size of the screen.
-        center_offset (tuple[float, float], optional): Custom center point as fractions of screen
-            size. Defaults to (0.5, 0.5).
     """
 
+    cell_pool: list[Cell] = []  # released cells shared between cell lines for reuse
+
     def __init__(
         self,
         hexagon_grid: HexagonGrid,
         game_state: GameState,
-        screen_size: tuple[int, int],
-        center_offset: tuple[float, float] = (0.5, 0.5),
     ) -> None:
-        self.center_offset = center_offset
-        self.cells = self._create_cells(hexagon_grid, game_state, screen_size, center_offset)
+        self.cells = self._create_cells(hexagon_grid, game_state)
+        self.new_cells: dict[tuple[int, int], Cell] = {}
 
     def replicate_cell(
         self,
         cell_coordinate: tuple[int, int],
         hexagon_grid: HexagonGrid,
         game_state: GameState,
-        screen_size: tuple[int, int],
     ) -> tuple[int, int] | None:
         """Replicates given mature cell to a new cell in the hexagon grid.
 
+        The new cell is kept in the new cells until they are added with add_new_cells, so the
+        cells can be iterated while replicating them.
+
         Args:
             cell_coordinate (tuple[int, int]): The coordinate of the cell to replicate.
             hexagon_grid (HexagonGrid): The hexagonal grid containing the cells.
             game_state (GameState): The game state containing the current game parameters.
-            screen_size (tuple[int, int]): The size of the screen.
 
         Returns:
             tuple[int, int] | None: The coordinates of the new cell or None if no unoccupied
                 neighbors are found.
         """
 
-        neighbor_coordinates = calculate_hexagon_neighbors(cell_coordinate)
-        unoccupied_hexagons = hexagon_grid.hexagons.keys() - self.cells.keys()
-        unoccupied_neighbors_coordinates = list(
-            set(neighbor_coordinates).intersection(unoccupied_hexagons)
-        )
+        unoccupied_neighbors_coordinates = [
+            neighbor_coordinate
+            for neighbor_coordinate in self.cells[cell_coordinate].hexagon.neighbor_coordinates
+            if neighbor_coordinate not in self.cells and neighbor_coordinate not in self.new_cells
+        ]
 
         if unoccupied_neighbors_coordinates:
             daughter_coordinates = random.choice(unoccupied_neighbors_coordinates)
-            daughter_cell = Cell(
-                daughter_coordinates,
-                game_state,
-                hexagon_grid.minimal_radius,
-                screen_size,
-                self.center_offset,
+            daughter_cell = self._get_cell(  # Energy value is inherited, so no variation
+                daughter_coordinates, hexagon_grid, game_state, energy_variation_sample=0.0
             )
 
             self.cells[cell_coordinate].energy_value /= 2
             daughter_cell.energy_value = self.cells[cell_coordinate].energy_value
-            self.cells[daughter_coordinates] = daughter_cell
+            self.new_cells[daughter_coordinates] = daughter_cell
             hexagon_grid.hexagons[daughter_coordinates].set_highlight()
 
             return daughter_coordinates
@@ -85,6 +81,18 @@ class CellLine:
 
         return None
 
+    def add_new_cells(self) -> None:
+        """Adds the new cells created by replication to the cells of the cell line."""
+
+        self.cells.update(self.new_cells)
+        self.new_cells.clear()
+
+    def release_cells(self) -> None:
+        """Releases all cells of the cell line to the cell pool to be reused by later cell lines."""
+
+        CellLine.cell_pool.extend(self.cells.values())
+        self.cells = {}
+
     def get_biomass(self) -> float:
         """Calculates the total biomass of the cell line.
 
@@ -98,63 +106,95 @@ class CellLine:
         self,
         hexagon_grid: HexagonGrid,
         game_state: GameState,
-        screen_size: tuple[int, int],
-        center_offset: tuple[float, float] = (0.5, 0.5),
     ) -> dict[tuple[int, int], Cell]:
         """Creates a cell line on given hexagon grid.
 
         Args:
             hexagon_grid (HexagonGrid): The hexagonal grid to create cells on.
             game_state (GameState): The game state containing the current game parameters.
-            screen_size (tuple[int, int]): The size of the screen.
-            center_offset (tuple[float, float], optional): Custom center point as fractions of
-                screen size. Defaults to (0.5, 0.5).
 
         Returns:
             dict[tuple[int, int], Cell]: A dictionary of cells with their coordinates as keys.
         """
 
         number_cells = min(game_state.number_cells, len(hexagon_grid.hexagons))
-        coordinates = self._generate_random_positions(hexagon_grid.hexagons, number_cells)
+        coordinates = self._generate_random_positions(hexagon_grid, number_cells)
+        energy_variation_samples = numpy.random.uniform(-1, 1, number_cells).tolist()
+        energy_consumption_rate_maximum = self._scale_energy_consumption_rate(
+            game_state.cell_energy_consumption_rate_maximum,
+            game_state.current_level,
+        )
 
         cells = {}
-        for i in range(number_cells):
-            cell = Cell(
-                coordinates[i], game_state, hexagon_grid.minimal_radius, screen_size, center_offset
-            )
-            cell.energy_consumption_rate_maximum = self._scale_energy_consumption_rate(
-                game_state.cell_energy_consumption_rate_maximum,
-                game_state.current_level,
-            )
-            cells[coordinates[i]] = cell
+        for coordinate, energy_variation_sample in zip(coordinates, energy_variation_samples):
+            cell = self._get_cell(coordinate, hexagon_grid, game_state, energy_variation_sample)
+            cell.energy_consumption_rate_maximum = energy_consumption_rate_maximum
+            cells[coordinate] = cell
 
         return cells
 
+    def _get_cell(
+        self,
+        coordinate_axial: tuple[int, int],
+        hexagon_grid: HexagonGrid,
+        game_state: GameState,
+        energy_variation_sample: float | None = None,
+    ) -> Cell:
+        """Gets a new cell on the given hexagon, reusing a released cell from the pool if available.
+
+        Args:
+            coordinate_axial (tuple[int, int]): The axial coordinates of the cell.
+            hexagon_grid (HexagonGrid): The hexagonal grid containing the cells.
+            game_state (GameState): The game state containing the current game parameters.
+            energy_variation_sample (float | None, optional): Precomputed uniform sample in
+                [-1, 1] for the energy variation. Defaults to None, drawing a new sample.
+
+        Returns:
+            Cell: The new cell.
+        """
+
+        hexagon = hexagon_grid.hexagons[coordinate_axial]
+
+        if CellLine.cell_pool:
+            cell = CellLine.cell_pool.pop()
+            cell.reset(
+                coordinate_axial,
+                hexagon,
+                game_state,
+                hexagon_grid.minimal_radius,
+                energy_variation_sample=energy_variation_sample,
+            )
+            return cell
+
+        return Cell(
+            coordinate_axial,
+            hexagon,
+            game_state,
+            hexagon_grid.minimal_radius,
+            energy_variation_sample=energy_variation_sample,
+        )
+
     def _generate_random_positions(
-        self, hexagons: dict[tuple[int, int], HexagonTile], number_cells: int
+        self, hexagon_grid: HexagonGrid, number_cells: int
     ) -> list[tuple[int, int]]:
         """Creates random cell positions with a Gaussian distribution around central hexagon.
 
         Args:
-            hexagons (dict[tuple[int, int], HexagonTile]): The hexagonal tiles.
+            hexagon_grid (HexagonGrid): The hexagonal grid to create cells on.
             number_cells (int): The number of cells to create.
 
         Returns:
             list[tuple[int, int]]: A list of random cell positions.
         """
 
-        random_coordinates, coordinate_probabilities = [], []
+        random_coordinates = hexagon_grid.hexagon_coordinates
 
-        for hexagon_coordinate in hexagons.keys():
-            distance_to_center = calculate_axial_distance((0, 0), hexagon_coordinate)
-            random_coordinates.append(hexagon_coordinate)
-            coordinate_probabilities.append(self._gaussian_probability(distance_to_center))
-
-        coordinate_probabilities /= numpy.array(
-            coordinate_probabilities
-        ).sum()  # Normalize probabilities to sum to 1
+        coordinate_probabilities = self._gaussian_probability(
+            hexagon_grid.hexagon_distances_to_center
+        )
+        coordinate_probabilities /= coordinate_probabilities.sum()  # Normalize to sum to 1
 
-        number_cells = min(number_cells, len(hexagons))
+        number_cells = min(number_cells, len(random_coordinates))
 
         selected_indices = numpy.random.choice(
             len(random_coordinates),
@@ -165,21 +205,20 @@ class CellLine:
 
         return [random_coordinates[i] for i in selected_indices]
 
-    def _gaussian_probability(self, distance: float, sigma: float = 0.25) -> float:
-        """Calculate gaussian probability from distance with given standard deviation.
+    def _gaussian_probability(self, distance: numpy.ndarray) -> numpy.ndarray:
+        """Calculate unnormalized gaussian probabilities from distances to the center.
+
+        The normalization coefficient of the gaussian is left out, since the probabilities are
+        normalized to sum to 1 by the caller anyway.
 
         Args:
-            distance (float): The distance from the center.
-            sigma (float, optional): The standard deviation. Defaults to 0.25.
+            distance (numpy.ndarray): The distances from the center.
 
         Returns:
-            float: The gaussian probability.
+            numpy.ndarray: The unnormalized gaussian probabilities.
         """
 
-        coefficient = 1 / (sigma * numpy.sqrt(2 * numpy.pi))
-        exponent = numpy.exp(-(distance**2) / (2 * sigma**2))
-
-        return coefficient * exponent
+        return numpy.exp(GAUSSIAN_EXPONENT_FACTOR * distance**2)
 
     def _scale_energy_consumption_rate(
         self,
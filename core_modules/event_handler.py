@@ -10,6 +10,32 @@ import sys
 import pygame
 from pygame.event import Event
 
+# The game is only controlled with the keyboard, so these events are never handled
+UNUSED_EVENT_TYPES: list[int] = [
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEWHEEL,
+    pygame.FINGERMOTION,
+    pygame.FINGERDOWN,
+    pygame.FINGERUP,
+    pygame.JOYAXISMOTION,
+    pygame.JOYBALLMOTION,
+    pygame.JOYHATMOTION,
+    pygame.JOYBUTTONDOWN,
+    pygame.JOYBUTTONUP,
+]
+
+
+def block_unused_events() -> None:
+    """Keep events that the game never handles out of the event queue.
+
+    Blocked events are dropped by SDL, so the game loops do not have to convert them to Python
+    events every frame, e.g. the many mouse motion events while the mouse is moved.
+    """
+
+    pygame.event.set_blocked(UNUSED_EVENT_TYPES)
+
 
 def handle_quit(
     event: Event,
@@ -7,7 +7,61 @@ It also provides methods to reset the game state and manage the number of levels
 
 
 class GameState:
-    """Class to manage the game state."""
+    """Class to manage the game state.
+
+    The attributes are stored in slots, so assigning an attribute that is not listed raises an
+    AttributeError instead of silently adding it.
+    """
+
+    __slots__ = (
+        # Settings
+        "default_number_levels",
+        "full_screen",
+        "show_fps",
+        # Hexagon defaults
+        "default_hexagon_minimal_radius_fraction",
+        "default_hexagon_nutrient_variation",
+        "default_hexagon_nutrient_richness",
+        # Cell defaults
+        "default_number_cells",
+        "default_cell_body_size",
+        "default_cell_body_color",
+        "default_cell_division_threshold",
+        "default_cell_energy_consumption_rate_maximum",
+        "default_cell_energy_affinity",
+        "default_cell_energy_color_index",
+        "default_cell_energy_initial",
+        "default_cell_energy_variation",
+        # General game defaults
+        "default_user",
+        "fps_maximum",
+        "fps_idle_maximum",
+        "default_number_shop_items",
+        "default_biomass_price",
+        "default_credits",
+        "max_number_levels",
+        "max_number_initial_cells",
+        # Game configs
+        "number_levels",
+        "current_level",
+        "current_biomass",
+        "run_biomass",
+        "biomass_price",
+        "current_credits",
+        # Hexagon configs
+        "hexagon_nutrient_variation",
+        "hexagon_nutrient_richness",
+        # Cell configs
+        "number_cells",
+        "cell_body_size",
+        "cell_body_color",
+        "cell_division_threshold",
+        "cell_energy_consumption_rate_maximum",
+        "cell_energy_affinity",
+        "cell_energy_color_index",
+        "cell_energy_initial",
+        "cell_energy_variation",
+    )
 
     def __init__(
         self,
@@ -37,6 +91,7 @@ class GameState:
         self.full_screen: bool = True
         self.default_user: str = "Unknown"
         self.fps_maximum: int = 50
+        self.fps_idle_maximum: int = 15  # for screens that only wait for input
         self.show_fps: bool = False
         self.default_number_shop_items: int = 3
         self.default_biomass_price: float = 100
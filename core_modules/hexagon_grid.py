@@ -9,6 +9,7 @@ the hexagon vertices and create hexagons with specific properties.
 
 import math
 import random
+from functools import lru_cache
 
 import numpy
 
@@ -17,8 +18,8 @@ from core_modules.game_state import GameState
 from core_modules.hexagon_tile import HexagonTile
 from core_modules.utils import (
     calculate_axial_distance,
+    calculate_hexagon_neighbors,
     calculate_pixel_from_axial,
-    convert_cube_to_axial,
 )
 
 
@@ -32,6 +33,8 @@ class HexagonGrid:
             size. Defaults to (0.5, 0.5).
     """
 
+    hexagon_pool: list[HexagonTile] = []  # released hexagons shared between grids for reuse
+
     def __init__(
         self,
         game_state: GameState,
@@ -42,15 +45,25 @@ class HexagonGrid:
             screen_size, game_state.default_hexagon_minimal_radius_fraction, center_offset
         )
         self.default_hexagon_body_color = list(Colors().hexagon_body)
+        self.hexagon_tiles: tuple[HexagonTile, ...] = ()
+        self.hexagon_tiles_source: dict[tuple[int, int], HexagonTile] | None = None
+        self.pixel_bounds: tuple[int, int, int, int] = (0, 0, 0, 0)
+        self.pixel_bounds_source: tuple[HexagonTile, ...] | None = None
         self.hexagons = self._create_hexagon_ring(
             game_state.current_level,
             game_state.hexagon_nutrient_variation,
             game_state.hexagon_nutrient_richness,
         )
-        self.update_hexagon_vertices(game_state, screen_size, center_offset)
+        self._update_coordinate_arrays()
+        self._update_hexagon_neighbors()
 
     def create_hexagon(
-        self, axial_coordinate, nutrient_variation: float, nutrient_richness: float
+        self,
+        axial_coordinate,
+        nutrient_variation: float,
+        nutrient_richness: float,
+        nutrient_randomness_factor: float | None = None,
+        coordinate_pixel: tuple[int, int] | None = None,
     ) -> HexagonTile:
         """Creates a hexagon tile with the given axial coordinates.
 
@@ -58,51 +71,50 @@ class HexagonGrid:
             axial_coordinate (tuple[int, int]): The axial coordinates of the hexagon.
             nutrient_variation (float): The variation of nutrient.
             nutrient_richness (float): The richness of nutrient.
+            nutrient_randomness_factor (float | None, optional): Precomputed uniform sample in
+                [-nutrient_richness, nutrient_richness]. Defaults to None, drawing a new sample.
+            coordinate_pixel (tuple[int, int] | None, optional): Precomputed pixel center of the
+                hexagon. Defaults to None, calculating it from the axial coordinates.
 
         Returns:
             HexagonTile: The created hexagon tile.
         """
 
         axial_distance_to_center = calculate_axial_distance((0, 0), axial_coordinate)
-        nutrient_distance_factor = numpy.exp(-nutrient_variation * axial_distance_to_center)
-        nutrient_randomness_factor = random.uniform(-nutrient_richness, nutrient_richness)
+        nutrient_distance_factor = math.exp(-nutrient_variation * axial_distance_to_center)
+        if nutrient_randomness_factor is None:
+            nutrient_randomness_factor = random.uniform(-nutrient_richness, nutrient_richness)
 
         nutrient_value = min(
             nutrient_distance_factor * (1 + nutrient_randomness_factor),
             1,
         )
 
-        vertices = self._get_hexagon_vertices(axial_coordinate)
+        if coordinate_pixel is None:
+            coordinate_pixel = calculate_pixel_from_axial(
+                self.screen_center_pixel, self.minimal_radius, axial_coordinate
+            )
+        vertices = self._get_hexagon_vertices(coordinate_pixel)
+
+        if HexagonGrid.hexagon_pool:
+            hexagon = HexagonGrid.hexagon_pool.pop()
+            hexagon.reset(
+                axial_coordinate,
+                coordinate_pixel,
+                vertices,
+                nutrient_value,
+                self.default_hexagon_body_color,
+            )
+            return hexagon
 
         return HexagonTile(
             axial_coordinate,
+            coordinate_pixel,
             vertices,
             nutrient_value,
             self.default_hexagon_body_color,
         )
 
-    def update_hexagon_vertices(
-        self,
-        game_state: GameState,
-        screen_size: tuple[int, int],
-        center_offset: tuple[float, float] = (0.5, 0.5),
-    ) -> None:
-        """Updates the vertices of all hexagons in the grid based on the new screen size.
-
-        Args:
-            game_state (GameState): The game state containing the current game parameters.
-            screen_size (tuple[int, int]): The new screen size.
-            center_offset (tuple[float, float], optional): Custom center point as fractions of
-                screen size. Defaults to (0.5, 0.5).
-        """
-
-        self._update_size_parameters(
-            screen_size, game_state.default_hexagon_minimal_radius_fraction, center_offset
-        )
-
-        for hexagon in self.hexagons.values():
-            hexagon.vertices = self._get_hexagon_vertices(hexagon.coordinate_axial)
-
     def recreate_background_hexagon_grid(
         self, game_state: GameState, screen_size: tuple[int, int], radius_fraction: int = 20
     ) -> None:
@@ -118,27 +130,81 @@ class HexagonGrid:
         game_state.default_hexagon_minimal_radius_fraction = radius_fraction
         self._update_size_parameters(screen_size, radius_fraction)
 
-        screen_width, screen_height = screen_size
-        number_r_hexagons = round(screen_width / self.maximal_radius / 2) + 9
-        number_q_hexagons = round(screen_height / self.minimal_radius / 2) + 4
-
-        coordinates = []
-        r_offset = -round(number_r_hexagons / 2)
-        q_offset = -round(number_q_hexagons / 2)
-        for r in range(number_r_hexagons):
-            for q in range(number_q_hexagons):
-                coordinates.append((r_offset + r, q_offset + q))
+        coordinates = self._get_background_coordinates(screen_size)
+        nutrient_randomness_factors = numpy.random.uniform(
+            -game_state.hexagon_nutrient_richness,
+            game_state.hexagon_nutrient_richness,
+            len(coordinates),
+        ).tolist()
+        coordinates_pixel = self._calculate_pixel_coordinates(coordinates)
 
         self.hexagons = {}
-        for coordinate in coordinates:
+        for coordinate, nutrient_randomness_factor, coordinate_pixel in zip(
+            coordinates, nutrient_randomness_factors, coordinates_pixel
+        ):
             self.hexagons[coordinate] = self.create_hexagon(
                 coordinate,
                 game_state.hexagon_nutrient_variation,
                 game_state.hexagon_nutrient_richness,
+                nutrient_randomness_factor,
+                coordinate_pixel,
             )
+        self._update_coordinate_arrays()
+        self._update_hexagon_neighbors()
 
         game_state.default_hexagon_minimal_radius_fraction = original_radius
 
+    def release_hexagons(self) -> None:
+        """Releases all hexagons of the grid to the hexagon pool to be reused by later grids."""
+
+        HexagonGrid.hexagon_pool.extend(self.hexagons.values())
+        self.hexagons = {}
+
+    def get_hexagon_tiles(self) -> tuple[HexagonTile, ...]:
+        """Get the hexagon tiles of the grid as a tuple, which is faster to iterate every frame.
+
+        Hexagons are never added to or removed from the hexagons of a grid, only replaced as a
+        whole, so the tuple is cached until the hexagons are replaced.
+
+        Returns:
+            tuple[HexagonTile, ...]: The hexagon tiles of the grid.
+        """
+
+        if self.hexagon_tiles_source is not self.hexagons:
+            self.hexagon_tiles = tuple(self.hexagons.values())
+            self.hexagon_tiles_source = self.hexagons
+
+        return self.hexagon_tiles
+
+    def get_pixel_bounds(self) -> tuple[int, int, int, int]:
+        """Get the screen area covered by the hexagons, e.g. to only update this area.
+
+        The bounds are cached until the hexagons are replaced or moved.
+
+        Returns:
+            tuple[int, int, int, int]: The left, top, width and height of the area in pixels.
+        """
+
+        hexagon_tiles = self.get_hexagon_tiles()
+        if self.pixel_bounds_source is not hexagon_tiles:
+            if hexagon_tiles:
+                x_coordinates = [hexagon.coordinate_pixel[0] for hexagon in hexagon_tiles]
+                y_coordinates = [hexagon.coordinate_pixel[1] for hexagon in hexagon_tiles]
+                margin = self.maximal_radius + 1  # Same margin as the rendered hexagon surfaces
+                left = min(x_coordinates) - margin
+                top = min(y_coordinates) - margin
+                self.pixel_bounds = (
+                    left,
+                    top,
+                    max(x_coordinates) + margin + 1 - left,
+                    max(y_coordinates) + margin + 1 - top,
+                )
+            else:
+                self.pixel_bounds = (0, 0, 0, 0)
+            self.pixel_bounds_source = hexagon_tiles
+
+        return self.pixel_bounds
+
     def get_total_nutrient(self) -> float:
         """Get the total nutrient remaining in all hexagons.
 
@@ -146,7 +212,68 @@ class HexagonGrid:
             float: The total nutrient value across all hexagons.
         """
 
-        return sum(hexagon.nutrient_value for hexagon in self.hexagons.values())
+        return sum(hexagon.nutrient_value for hexagon in self.get_hexagon_tiles())
+
+    def _update_coordinate_arrays(self) -> None:
+        """Updates the arrays of hexagon coordinates and distances to the center hexagon.
+
+        The arrays are in the same order as the hexagons and allow vectorized queries over the
+        whole grid without iterating the hexagon tiles.
+        """
+
+        self.hexagon_coordinates = list(self.hexagons.keys())
+
+        axial_coordinates = numpy.array(self.hexagon_coordinates, dtype=numpy.int32).reshape(-1, 2)
+        r_coordinates, q_coordinates = axial_coordinates[:, 0], axial_coordinates[:, 1]
+        self.hexagon_distances_to_center = (
+            numpy.abs(r_coordinates)
+            + numpy.abs(q_coordinates)
+            + numpy.abs(r_coordinates + q_coordinates)
+        ) // 2
+
+    def _update_hexagon_neighbors(self) -> None:
+        """Stores the coordinates of the neighbors within the grid on every hexagon.
+
+        The neighbors of a hexagon do not change while the grid exists, so they are looked up
+        once here instead of every time a cell on the hexagon replicates.
+        """
+
+        hexagons = self.hexagons
+        for coordinate, hexagon in hexagons.items():
+            hexagon.neighbor_coordinates = tuple(
+                neighbor_coordinate
+                for neighbor_coordinate in calculate_hexagon_neighbors(coordinate)
+                if neighbor_coordinate in hexagons
+            )
+
+    def _calculate_pixel_coordinates(
+        self, axial_coordinates: list[tuple[int, int]]
+    ) -> list[tuple[int, int]]:
+        """Calculates the pixel centers of many hexagons at once.
+
+        This is the vectorized version of calculate_pixel_from_axial with the grid center and
+        radius, giving the same pixel coordinates without a Python function call per hexagon.
+
+        Args:
+            axial_coordinates (list[tuple[int, int]]): The axial coordinates of the hexagons.
+
+        Returns:
+            list[tuple[int, int]]: The pixel coordinates of the hexagons in the same order.
+        """
+
+        axial_array = numpy.array(axial_coordinates, dtype=numpy.int64).reshape(-1, 2)
+        r_coordinates, q_coordinates = axial_array[:, 0], axial_array[:, 1]
+
+        x_coordinates_pixel = (
+            self.screen_center_pixel[0]
+            + r_coordinates * 2 * self.minimal_radius
+            + self.minimal_radius * q_coordinates
+        )
+        y_coordinates_pixel = numpy.rint(
+            self.screen_center_pixel[1] + q_coordinates * math.sqrt(3) * self.minimal_radius
+        ).astype(numpy.int64)
+
+        return list(zip(x_coordinates_pixel.tolist(), y_coordinates_pixel.tolist()))
 
     def _update_size_parameters(
         self,
@@ -186,24 +313,57 @@ class HexagonGrid:
 
         hexagon_grid = {}
         hexagon_coordinates = self._get_neighbor_coordinates_with_distance((0, 0), number_rings)
-
-        for axial_coordinates in hexagon_coordinates:
+        nutrient_randomness_factors = numpy.random.uniform(
+            -nutrient_richness, nutrient_richness, len(hexagon_coordinates)
+        ).tolist()
+        coordinates_pixel = self._calculate_pixel_coordinates(hexagon_coordinates)
+
+        for axial_coordinates, nutrient_randomness_factor, coordinate_pixel in zip(
+            hexagon_coordinates, nutrient_randomness_factors, coordinates_pixel
+        ):
             hexagon = self.create_hexagon(
                 axial_coordinates,
                 nutrient_variation,
                 nutrient_richness,
+                nutrient_randomness_factor,
+                coordinate_pixel,
             )
             hexagon_grid[axial_coordinates] = hexagon
 
         return hexagon_grid
 
+    def _get_background_coordinates(self, screen_size: tuple[int, int]) -> list[tuple[int, int]]:
+        """Calculates the axial coordinates of a background grid covering the whole screen.
+
+        Args:
+            screen_size (tuple[int, int]): The screen size.
+
+        Returns:
+            list[tuple[int, int]]: A list of axial coordinates of the background hexagons.
+        """
+
+        screen_width, screen_height = screen_size
+        number_r_hexagons = round(screen_width / self.maximal_radius / 2) + 9
+        number_q_hexagons = round(screen_height / self.minimal_radius / 2) + 4
+
+        coordinates = []
+        r_offset = -round(number_r_hexagons / 2)
+        q_offset = -round(number_q_hexagons / 2)
+        for r in range(number_r_hexagons):
+            for q in range(number_q_hexagons):
+                coordinates.append((r_offset + r, q_offset + q))
+
+        return coordinates
+
     def _get_neighbor_coordinates_with_distance(
         self, center_axial: tuple[int, int], distance_axial: int
     ) -> list[tuple[int, int]]:
         """Calculates all hexagon tiles with the given distance from the center.
 
-        The coordinates are calculated in cube coordinates (r, q, s) and then converted to axial
-        coordinates (r, q),. Valid hexagons are selected with r + q + s = 0.
+        The coordinates are enumerated in axial coordinates (r, q), bounding q for every r so that
+        the implied cube coordinate s = -r - q is within the distance as well. This yields the
+        3 * d * (d + 1) + 1 hexagons directly instead of filtering all cube coordinates. The rows
+        of q coordinates are built with numpy instead of a Python loop per hexagon.
 
         Args:
             center_axial (tuple[int, int]): The axial coordinates of the center hexagon.
@@ -213,42 +373,59 @@ class HexagonGrid:
             list[tuple[int, int]]: A list of axial coordinates of hexagons within given distance.
         """
 
-        base_vector = list(range(-distance_axial, distance_axial + 1))
-        coordinates = []
-        for r in base_vector:
-            for q in base_vector:
-                for s in base_vector:
-                    if r + q + s == 0:
-                        coordinate = convert_cube_to_axial((r, q, s))
-                        coordinate = (
-                            coordinate[0] + center_axial[0],
-                            coordinate[1] + center_axial[1],
-                        )
-                        coordinates.append(coordinate)
+        r_rows = numpy.arange(-distance_axial, distance_axial + 1)
+        q_minimums = numpy.maximum(-distance_axial, -r_rows - distance_axial)
+        q_maximums = numpy.minimum(distance_axial, -r_rows + distance_axial)
+        row_lengths = q_maximums - q_minimums + 1
 
-        return coordinates
+        # Every row counts up from its minimal q, so subtract the index of the row start
+        row_starts = numpy.cumsum(row_lengths) - row_lengths
+        q_coordinates = numpy.repeat(q_minimums - row_starts, row_lengths) + numpy.arange(
+            row_lengths.sum()
+        )
+        r_coordinates = numpy.repeat(r_rows, row_lengths)
+
+        return list(
+            zip(
+                (r_coordinates + center_axial[0]).tolist(),
+                (q_coordinates + center_axial[1]).tolist(),
+            )
+        )
 
     def _get_hexagon_vertices(
-        self, hexagon_coordinate_axial: tuple[int, int]
+        self, hexagon_coordinate_pixel: tuple[int, int]
     ) -> list[tuple[float, float]]:
-        """Calculates the vertices of a hexagon based on its axial coordinates.
+        """Calculates the vertices of a hexagon based on its pixel center.
 
         Args:
-            hexagon_coordinate_axial (tuple[int, int]): The axial coordinates of the hexagon.
+            hexagon_coordinate_pixel (tuple[int, int]): The pixel coordinates of the hexagon center.
 
         Returns:
             list[tuple[float, float]]: A list of vertices of the hexagon.
         """
 
-        x_coordinate_pixel, y_coordinate_pixel = calculate_pixel_from_axial(
-            self.screen_center_pixel, self.minimal_radius, hexagon_coordinate_axial
-        )
+        x_coordinate_pixel, y_coordinate_pixel = hexagon_coordinate_pixel
+
+        return [
+            (x_coordinate_pixel + x_offset, y_coordinate_pixel + y_offset)
+            for x_offset, y_offset in _get_hexagon_vertex_offsets(self.maximal_radius)
+        ]
+
+
+@lru_cache(maxsize=16)
+def _get_hexagon_vertex_offsets(maximal_radius: int) -> tuple[tuple[float, float], ...]:
+    """Calculates the vertex offsets from the center shared by all hexagons of the same radius.
+
+    Args:
+        maximal_radius (int): The maximal radius of the hexagon.
+
+    Returns:
+        tuple[tuple[float, float], ...]: The offsets of the six vertices from the hexagon center.
+    """
 
-        vertices = []
-        for i in range(6):
-            angle = math.radians(30 + 60 * i)  # 60 degrees increments for hexagon inner angles
-            x = x_coordinate_pixel + self.maximal_radius * math.cos(angle)
-            y = y_coordinate_pixel + self.maximal_radius * math.sin(angle)
-            vertices.append((x, y))
+    offsets = []
+    for i in range(6):
+        angle = math.radians(30 + 60 * i)  # 60 degrees increments for hexagon inner angles
+        offsets.append((maximal_radius * math.cos(angle), maximal_radius * math.sin(angle)))
 
-        return vertices
+    return tuple(offsets)
@@ -18,26 +18,75 @@ class HexagonTile:
 
     Args:
         coordinate_axial (tuple[int, int]): The axial coordinates of the hexagon.
+        coordinate_pixel (tuple[int, int]): The pixel coordinates of the hexagon center.
         vertices (list[tuple[float, float]]): The vertices of the hexagon.
         nutrient_value (float): The nutrient value of the hexagon.
         default_body_color (list[int]): The default body color of the hexagon.
         highlight_ticks (int): The number of ticks to highlight the hexagon. Defaults to 0.
     """
 
+    __slots__ = (
+        "coordinate_axial",
+        "coordinate_pixel",
+        "vertices",
+        "nutrient_value",
+        "highlight_ticks",
+        "body_color",
+        "neighbor_coordinates",
+    )
+
     def __init__(
         self,
         coordinate_axial: tuple[int, int],
+        coordinate_pixel: tuple[int, int],
         vertices: list[tuple[float, float]],
         nutrient_value: float,
         default_body_color: list[int],
+        *,
         highlight_ticks: int = 0,
     ) -> None:
+        # Defaults of the attributes that are also changed outside of reset
+        self.nutrient_value: float = 0.0
+        self.highlight_ticks: int = 0
+        self.body_color: tuple[int, ...] = ()
+        self.reset(
+            coordinate_axial,
+            coordinate_pixel,
+            vertices,
+            nutrient_value,
+            default_body_color,
+            highlight_ticks=highlight_ticks,
+        )
+
+    def reset(
+        self,
+        coordinate_axial: tuple[int, int],
+        coordinate_pixel: tuple[int, int],
+        vertices: list[tuple[float, float]],
+        nutrient_value: float,
+        default_body_color: list[int],
+        *,
+        highlight_ticks: int = 0,
+    ) -> None:
+        """Reset the hexagon to a newly created hexagon, allowing a hexagon instance to be reused.
+
+        Args:
+            coordinate_axial (tuple[int, int]): The axial coordinates of the hexagon.
+            coordinate_pixel (tuple[int, int]): The pixel coordinates of the hexagon center.
+            vertices (list[tuple[float, float]]): The vertices of the hexagon.
+            nutrient_value (float): The nutrient value of the hexagon.
+            default_body_color (list[int]): The default body color of the hexagon.
+            highlight_ticks (int): The number of ticks to highlight the hexagon. Defaults to 0.
+        """
+
         self.coordinate_axial = coordinate_axial
+        self.coordinate_pixel = coordinate_pixel
         self.vertices = vertices
         self.nutrient_value = nutrient_value
         self.highlight_ticks = highlight_ticks
+        self.neighbor_coordinates: tuple[tuple[int, int], ...] = ()  # set by the hexagon grid
 
-        self.body_color = default_body_color.copy()
+        self.body_color = tuple(default_body_color)  # Hashable for rendering
         self._update_body_color()
 
     def update(self, cell: Cell) -> Cell:
@@ -50,17 +99,22 @@ class HexagonTile:
             Cell: The updated cell.
         """
 
-        self.nutrient_value, cell.energy_value, cell.growth = update_nutrient_value(
-            nutrient_value=self.nutrient_value,
-            energy_value=cell.energy_value,
-            growth=cell.growth,
-            energy_consumption_rate_maximum=cell.energy_consumption_rate_maximum,
-            energy_affinity=cell.energy_affinity,
-            division_threshold=cell.division_threshold,
+        # Arguments are passed positionally, keyword arguments are slower to dispatch by numba
+        nutrient_value, cell.energy_value, cell.growth = update_nutrient_value(
+            self.nutrient_value,
+            cell.energy_value,
+            cell.growth,
+            cell.energy_consumption_rate_maximum,
+            cell.energy_affinity,
+            cell.division_threshold,
         )
 
-        self._update_highlight_ticks()
-        self._update_body_color()
+        # Highlight and body color updates are inlined, this runs for every growing cell per frame
+        if self.highlight_ticks > 0:
+            self.highlight_ticks -= 1
+        if nutrient_value != self.nutrient_value:
+            self.nutrient_value = nutrient_value
+            self._update_body_color()
 
         return cell
 
@@ -112,12 +166,7 @@ class HexagonTile:
         return cell
 
     def _update_body_color(self) -> None:
-        """Updates the body color of the hexagon."""
-
-        self.body_color[1] = round(self.nutrient_value * 255)
-
-    def _update_highlight_ticks(self) -> None:
-        """Updates the highlight ticks of the hexagon."""
+        """Updates the nutrient channel of the body color of the hexagon."""
 
-        if self.highlight_ticks > 0:
-            self.highlight_ticks -= 1
+        red, _, blue = self.body_color
+        self.body_color = (red, round(self.nutrient_value * 255), blue)
@@ -188,7 +188,7 @@ class ProcessPlotter:
             raw_data = renderer.tostring_rgb()
 
             size = canvas.get_width_height()
-            surface = pygame.image.fromstring(raw_data, size, "RGB")
+            surface = pygame.image.fromstring(raw_data, size, "RGB").convert()
 
             plt.close(fig)
 
@@ -4,9 +4,6 @@ import math
 import time
 from typing import Dict, List
 
-from core_modules.cell_line import CellLine
-from core_modules.hexagon_grid import HexagonGrid
-
 
 class ProcessTracker:
     """Lightweight class to track essential process parameters for plotting."""
@@ -37,23 +34,23 @@ class ProcessTracker:
             self.is_paused = False
             self.total_pause_duration += time.time() - self.pause_start_time
 
-    def update(self, cell_line: CellLine, hexagon_grid: HexagonGrid) -> None:
+    def update(self, current_biomass: float, current_substrate: float) -> None:
         """Update the tracked parameters with current game state.
 
         Args:
-            cell_line (CellLine): Current cell line with all cells.
-            hexagon_grid (HexagonGrid): The hexagon grid containing nutrient data.
+            current_biomass (float): Total biomass of the cell line, kept up to date by the
+                caller while updating the cells.
+            current_substrate (float): Total nutrient of the hexagon grid.
         """
 
         if self.is_paused:
             return
 
         current_time = time.time() - self.start_time - self.total_pause_duration
-        current_biomass = cell_line.get_biomass()
 
         self.timestamps.append(current_time)
         self.total_biomass.append(current_biomass)
-        self.total_substrate.append(hexagon_grid.get_total_nutrient())
+        self.total_substrate.append(current_substrate)
 
         if len(self.total_biomass) >= 2:
             window_size = min(5, len(self.total_biomass))
@@ -6,6 +6,7 @@ The class provides methods to handle rendering in both full screen and windowed
 to manage the rendering of different game states and objects.
 """
 
+import math
 from typing import Any
 
 import pygame
@@ -19,6 +20,8 @@ from core_modules.cell_line import CellLine
 from core_modules.game_state import GameState
 from core_modules.hexagon_grid import HexagonGrid
 
+TEXT_SURFACE_CACHE_SIZE = 256  # rendered texts kept for reuse, bounds changing value texts
+
 
 class RenderManager:
     """Manages rendering objects on the screen.
@@ -31,26 +34,52 @@ class RenderManager:
     def __init__(self, initial_screen_size: tuple[int, int], full_screen: bool = False) -> None:
         self.windowed_screen_size: tuple[int, int] = (1024, 576)
         self.current_screen_size: tuple[int, int] = initial_screen_size
-        self.toggle_full_screen(full_screen)
+        self.cell_surfaces: dict[int, pygame.Surface] = {}
+        self.hexagon_surfaces: dict[tuple[int, tuple[int, ...], bool], pygame.Surface] = {}
+        self.shadow_overlays: dict[tuple[str, int], pygame.Surface] = {}
+        self.text_surfaces: dict[tuple, tuple[pygame.Surface, pygame.Rect]] = {}
+        self.scaled_images: dict[tuple, tuple[pygame.Surface, pygame.Rect]] = {}
+        self.animation_frame_names: dict[str, list[str]] = {}
+        self.fps_rect: pygame.Rect | None = None
+        self.background_hexagons: dict | None = None
+        self.background_shadow_alpha: int = 0
+        self.background_surface: pygame.Surface | None = None
+        self.toggle_full_screen(full_screen)  # Sets up the screen, image and font assets
 
-        self.image_assets: ImageAssets = ImageAssets(self.current_screen_size)
-        self.font_assets: FontAssets = FontAssets(self.current_screen_size)
         self.colors: Colors = Colors()
 
-    def update_screen(self, game_state: GameState, clock: Clock) -> None:
+    def update_screen(
+        self,
+        game_state: GameState,
+        clock: Clock,
+        dirty_rects: list[pygame.Rect] | None = None,
+        fps_limit: int | None = None,
+    ) -> None:
         """Updates the screen with the current game state and clock.
 
         THis method is responsible for updating the screen with rendered objects,
         including FPS display, background color, and any other game elements.
 
+        If dirty rectangles are given, only these areas and the FPS display are updated on the
+        display instead of the whole screen. This is only faster for a few small areas, so the
+        whole screen is updated for many rectangles.
+
         Args:
             game_state (GameState): The current game state.
             clock (Clock): The clock to manage the game loop.
+            dirty_rects (list[pygame.Rect] | None, optional): Changed areas of the screen.
+                Defaults to None, updating the whole screen.
+            fps_limit (int | None, optional): Frame rate limit, e.g. for screens that only wait
+                for input. Defaults to None, using the maximum frame rate of the game state.
         """
 
-        self.render_fps(game_state, clock, "small_font")
-        pygame.display.flip()
-        clock.tick(game_state.fps_maximum)
+        fps_rect = self.render_fps(game_state, clock, "small_font")
+        if dirty_rects is None or len(dirty_rects) > 50:
+            pygame.display.flip()
+        else:
+            pygame.display.update([*dirty_rects, fps_rect, self.fps_rect])  # Skips None
+        self.fps_rect = fps_rect
+        clock.tick(fps_limit or game_state.fps_maximum)
 
     def toggle_full_screen(self, full_screen: bool) -> None:
         """Toggles between full screen and windowed mode.
@@ -65,8 +94,13 @@ class RenderManager:
             self.screen = pygame.display.set_mode(self.windowed_screen_size)
 
         self.current_screen_size = self.screen.get_size()
-        self.image_assets = ImageAssets(self.current_screen_size)
-        self.font_assets = FontAssets(self.current_screen_size)
+        self.scaled_images = {}
+        self.hexagon_surfaces = {}  # Hexagon sizes depend on the screen size
+        self.shadow_overlays = {}
+        self.text_surfaces = {}  # Font sizes depend on the screen size
+        self.background_hexagons = None
+        self.image_assets: ImageAssets = ImageAssets(self.current_screen_size)
+        self.font_assets: FontAssets = FontAssets(self.current_screen_size)
 
     def render_background_color(self, color: str) -> None:
         """Renders a background color on the screen.
@@ -83,7 +117,7 @@ class RenderManager:
         images_per_second: int,
         position_args: dict[str, tuple[float, float]],
         size_args: tuple[str, float],
-    ) -> None:
+    ) -> pygame.Rect:
         """Renders an animation on the screen.
 
         Position args are in the form of a dictionary with keys as
@@ -99,19 +133,27 @@ class RenderManager:
             images_per_second (int): Number of frames per second.
             position_args (dict[str, tuple[float, float]]): Position of the animation as fractions.
             size_args (tuple[str, float]): Size of the animation as a fraction of the screen size.
+
+        Returns:
+            pygame.Rect: The area of the rendered animation frame.
         """
 
         image_list = self.image_assets.get_animation_frames(image_name)
         if not image_list:
             raise ValueError(f"Animation '{image_name}' not found in assets.")
 
-        number_of_images = len(image_list)
-        image_index = int(pygame.time.get_ticks() / (1000 / images_per_second) % number_of_images)
+        frame_names = self.animation_frame_names.get(image_name)
+        if frame_names is None:  # Scaled image cache names of the frames
+            frame_names = [f"{image_name}/{i}" for i in range(len(image_list))]
+            self.animation_frame_names[image_name] = frame_names
 
-        self._render_surface(
+        image_index = pygame.time.get_ticks() * images_per_second // 1000 % len(image_list)
+
+        return self._render_surface(
             surface=image_list[image_index],
             position_args=position_args,
             size_args=size_args,
+            cache_name=frame_names[image_index],
         )
 
     def render_image(
@@ -119,7 +161,7 @@ class RenderManager:
         image_name: str,
         position_args: dict[str, tuple[float, float]],
         size_args: tuple[str, float],
-    ) -> None:
+    ) -> pygame.Rect:
         """Renders a static image on the screen.
 
         Position args are in the form of a dictionary with keys as
@@ -134,16 +176,20 @@ class RenderManager:
             image_name (str): Name of the image to render.
             position_args (dict[str, tuple[float, float]]): Position of the image as fractions.
             size_args (tuple[str, float]): Size of the image as a fraction of the screen size.
+
+        Returns:
+            pygame.Rect: The area of the rendered image.
         """
 
         image = self.image_assets.get_image(image_name)
         if image is None:
             raise ValueError(f"Image '{image_name}' not found in assets.")
 
-        self._render_surface(
+        return self._render_surface(
             surface=image,
             position_args=position_args,
             size_args=size_args,
+            cache_name=image_name,
         )
 
     def _render_surface(
@@ -151,7 +197,8 @@ class RenderManager:
         surface: pygame.Surface,
         position_args: dict[str, tuple[float, float]],
         size_args: tuple[str, float],
-    ) -> None:
+        cache_name: str | None = None,
+    ) -> pygame.Rect:
         """Scales and renders a given surface.
 
         Position args are in the form of a dictionary with keys as
@@ -166,8 +213,22 @@ class RenderManager:
             surface (pygame.Surface): The surface to render.
             position_args (dict[str, tuple[float, float]]): Position of the surface as fractions.
             size_args (tuple[str, float]): Size of the surface as a fraction of the screen size.
+            cache_name (str | None, optional): Name to cache the scaled surface and its rectangle
+                under, so the same surface is only scaled and positioned once per screen size.
+                Defaults to None.
+
+        Returns:
+            pygame.Rect: The area of the rendered surface.
         """
 
+        pos_key = next(iter(position_args))
+        placement_key = (cache_name, size_args, pos_key, position_args[pos_key])
+        if cache_name is not None:
+            placement = self.scaled_images.get(placement_key)
+            if placement is not None:
+                self.screen.blit(*placement)
+                return placement[1]
+
         # Scaling
         base_dimension, fraction = size_args
         if base_dimension == "width":
@@ -183,7 +244,6 @@ class RenderManager:
         scaled_surface = pygame.transform.scale(surface, (new_width, new_height))
 
         # Positioning
-        pos_key = next(iter(position_args))
         fraction_x, fraction_y = position_args[pos_key]
         pixel_position = (
             int(fraction_x * self.current_screen_size[0]),
@@ -191,46 +251,145 @@ class RenderManager:
         )
 
         surface_rect = scaled_surface.get_rect(**{pos_key: pixel_position})
+        if cache_name is not None:
+            self.scaled_images[placement_key] = (scaled_surface, surface_rect)
         self.screen.blit(scaled_surface, surface_rect)
 
-    def render_shadow_overlay(self, color: str = "black", alpha: int = 60) -> None:
+        return surface_rect
+
+    def render_shadow_overlay(
+        self, color: str = "black", alpha: int = 60, surface: pygame.Surface | None = None
+    ) -> None:
         """Renders a shadow overlay on the screen.
 
         This method creates a semi-transparent overlay on the screen to
         simulate a shadow effect. The overlay is filled with the specified
-        color and has a specified alpha value for transparency.
+        color and has a specified alpha value for transparency. Overlays are
+        cached by color and alpha value instead of being created every frame.
 
         Args:
             color (str, optional): Color of the shade overlay. Defaults to "black".
             alpha (int, optional): Opaqueness value of shade overlay. Defaults to 60.
+            surface (pygame.Surface | None, optional): Surface to render the overlay on.
+                Defaults to None, rendering on the screen.
         """
 
-        shade_overlay = pygame.Surface(self.current_screen_size)
-        shade_overlay.fill(getattr(self.colors, color))
-        shade_overlay.set_alpha(alpha)
-        self.screen.blit(shade_overlay, (0, 0))
+        if surface is None:
+            surface = self.screen
 
-    def render_hexagons(self, hexagon_grid: HexagonGrid) -> None:
+        shade_overlay = self.shadow_overlays.get((color, alpha))
+        if shade_overlay is None:
+            shade_overlay = pygame.Surface(self.current_screen_size).convert()
+            shade_overlay.fill(getattr(self.colors, color))
+            shade_overlay.set_alpha(alpha)
+            self.shadow_overlays[(color, alpha)] = shade_overlay
+
+        surface.blit(shade_overlay, (0, 0))
+
+    def render_background_hexagons(self, hexagon_grid: HexagonGrid, shadow_alpha: int = 0) -> None:
+        """Renders a static background hexagon grid on the screen.
+
+        The hexagons of background grids do not change between frames, so they are rendered once
+        together with their shadow overlay into a screen sized surface, which is blitted instead
+        of all hexagons and the overlay. The surface is rendered again when the hexagons of the
+        grid, the shadow or the screen mode change.
+
+        Args:
+            hexagon_grid (HexagonGrid): The background grid containing hexagons to render.
+            shadow_alpha (int, optional): Opaqueness of the black shadow overlay on the grid.
+                Defaults to 0, rendering no shadow overlay.
+        """
+
+        if (
+            self.background_hexagons is not hexagon_grid.hexagons
+            or self.background_shadow_alpha != shadow_alpha
+        ):
+            self.background_surface = pygame.Surface(self.current_screen_size).convert()
+            self.render_hexagons(hexagon_grid, self.background_surface)
+            if shadow_alpha:
+                self.render_shadow_overlay("black", shadow_alpha, self.background_surface)
+            self.background_hexagons = hexagon_grid.hexagons
+            self.background_shadow_alpha = shadow_alpha
+
+        self.screen.blit(self.background_surface, (0, 0))
+
+    def render_hexagons(
+        self, hexagon_grid: HexagonGrid, surface: pygame.Surface | None = None
+    ) -> None:
         """Renders hexagons on the screen.
 
         Args:
             hexagon_grid (HexagonGrid): The grid containing hexagons to render.
+            surface (pygame.Surface | None, optional): Surface to render the hexagons on.
+                Defaults to None, rendering on the screen.
         """
 
-        for hexagon in hexagon_grid.hexagons.values():
-            if hexagon.highlight_ticks > 0:
+        maximal_radius = hexagon_grid.maximal_radius
+        surface_offset = maximal_radius + 1
+
+        hexagon_blits = []
+        for hexagon in hexagon_grid.get_hexagon_tiles():
+            highlighted = hexagon.highlight_ticks > 0
+            if highlighted:
                 hexagon.highlight_ticks -= 1
-                hexagon_body_color = [
-                    min(round(hexagon.body_color[0] + 50), 255),
-                    min(round(hexagon.body_color[1] + 50), 255),
-                    min(round(hexagon.body_color[2] + 50), 255),
-                ]
-            else:
-                hexagon_body_color = hexagon.body_color
-            pygame.draw.polygon(self.screen, hexagon_body_color, hexagon.vertices)
-            pygame.draw.aalines(
-                self.screen, self.colors.black, closed=True, points=hexagon.vertices
+            hexagon_blits.append(
+                (
+                    self._get_hexagon_surface(maximal_radius, hexagon.body_color, highlighted),
+                    (
+                        hexagon.coordinate_pixel[0] - surface_offset,
+                        hexagon.coordinate_pixel[1] - surface_offset,
+                    ),
+                )
             )
+        if surface is None:
+            surface = self.screen
+        surface.blits(hexagon_blits, doreturn=False)
+
+    def _get_hexagon_surface(
+        self, maximal_radius: int, body_color: tuple[int, ...], highlighted: bool = False
+    ) -> pygame.Surface:
+        """Gets the hexagon surface for the given size and color, drawing it on first use.
+
+        All hexagons of a grid have the same shape, so the polygon and its outline are drawn once
+        per color and highlight state and blitted for every hexagon instead of being drawn for
+        each hexagon. The body color only varies in its nutrient channel, so the number of cached
+        surfaces stays bounded.
+
+        Args:
+            maximal_radius (int): Maximal radius of the hexagon in pixels.
+            body_color (tuple[int, ...]): Body color of the hexagon.
+            highlighted (bool, optional): Whether the hexagon is highlighted. Defaults to False.
+
+        Returns:
+            pygame.Surface: Transparent surface with the hexagon body and outline.
+        """
+
+        hexagon_key = (maximal_radius, body_color, highlighted)
+        hexagon_surface = self.hexagon_surfaces.get(hexagon_key)
+        if hexagon_surface is None:
+            if highlighted:
+                body_color = tuple(min(round(channel + 50), 255) for channel in body_color)
+
+            surface_center = maximal_radius + 1
+            vertices = []
+            for i in range(6):
+                angle = math.radians(30 + 60 * i)  # Same vertices as the hexagon grid
+                vertices.append(
+                    (
+                        surface_center + maximal_radius * math.cos(angle),
+                        surface_center + maximal_radius * math.sin(angle),
+                    )
+                )
+
+            hexagon_surface = pygame.Surface(
+                (2 * surface_center + 1, 2 * surface_center + 1), pygame.SRCALPHA
+            )
+            pygame.draw.polygon(hexagon_surface, body_color, vertices)
+            pygame.draw.aalines(hexagon_surface, self.colors.black, closed=True, points=vertices)
+            hexagon_surface = hexagon_surface.convert_alpha()  # Display format for fast blits
+            self.hexagon_surfaces[hexagon_key] = hexagon_surface
+
+        return hexagon_surface
 
     def render_cells(self, cell_line: CellLine) -> None:
         """Renders cells on the screen.
@@ -239,17 +398,43 @@ class RenderManager:
             cells (dict[tuple[int, int], Any]): Cells to render.
         """
 
+        cell_blits = []
         for cell in cell_line.cells.values():
+            radius = cell.radius
+            cell_blits.append(
+                (
+                    self._get_cell_surface(radius),
+                    (cell.coordinate_pixel[0] - radius, cell.coordinate_pixel[1] - radius),
+                )
+            )
+        self.screen.blits(cell_blits, doreturn=False)
+
+    def _get_cell_surface(self, radius: int) -> pygame.Surface:
+        """Gets the cell surface for the given radius, drawing it on first use.
+
+        Cell radii are drawn in whole pixels, so only a small number of distinct cell surfaces
+        exist and they are cached instead of drawing two circles per cell every frame.
+
+        Args:
+            radius (int): Radius of the cell in pixels.
+
+        Returns:
+            pygame.Surface: Transparent surface with the cell body and border.
+        """
+
+        cell_surface = self.cell_surfaces.get(radius)
+        if cell_surface is None:
+            cell_surface = pygame.Surface((2 * radius + 1, 2 * radius + 1), pygame.SRCALPHA)
             pygame.draw.circle(  # Cell body
-                self.screen, self.colors.cell_body, cell.coordinate_pixel, cell.radius
+                cell_surface, self.colors.cell_body, (radius, radius), radius
             )
             pygame.draw.circle(  # Cell border
-                self.screen,
-                self.colors.black,
-                cell.coordinate_pixel,
-                cell.radius,
-                1,
+                cell_surface, self.colors.black, (radius, radius), radius, 1
             )
+            cell_surface = cell_surface.convert_alpha()  # Display format for fast blits
+            self.cell_surfaces[radius] = cell_surface
+
+        return cell_surface
 
     def render_text(
         self,
@@ -259,13 +444,16 @@ class RenderManager:
         position_args: dict[str, tuple[float, float]],
         highlight: bool = False,
         highlight_color: str | None = None,
-    ) -> None:
+    ) -> pygame.Rect:
         """Renders text on the screen.
 
         Position args are in the form of a dictionary with keys as
         "topleft", "topright", "bottomleft", "bottomright", "center"
         and values as tuples of fractions of the screen size.
 
+        Rendered texts are cached with their positioned rectangle by their content and position,
+        as most texts, including value texts and options, are the same over many frames.
+
         Args:
             text (str): Text to render.
             font_name (str): Name of the font to use.
@@ -273,16 +461,13 @@ class RenderManager:
             position_args (dict[str, tuple[float, float]]): Position of the text as fractions.
             highlight (bool, optional): Whether to highlight the text. Defaults to False.
             highlight_color (str | None, optional): Color of the highlighted text. Defaults to None.
+
+        Returns:
+            pygame.Rect: The area of the screen covered by the text.
         """
 
-        # Convert position_args to pixel values
         positioning = next(iter(position_args))
-        position_args = {
-            positioning: (
-                round(position_args[positioning][0] * self.current_screen_size[0]),
-                round(position_args[positioning][1] * self.current_screen_size[1]),
-            )
-        }
+        position = position_args[positioning]
 
         font_color: tuple[int, int, int] = getattr(self.colors, font_color_name)
         if highlight:
@@ -294,10 +479,27 @@ class RenderManager:
                 )
             else:
                 font_color = getattr(self.colors, highlight_color)
-        font: Font = getattr(self.font_assets, font_name)
-        text_surface = font.render(text, True, font_color)
-        text_rect = text_surface.get_rect(**position_args)
-        self.screen.blit(text_surface, text_rect)
+
+        # Texts are kept in order of last use, so changing value texts only evict stale texts
+        text_key = (text, font_name, font_color, positioning, position)
+        text_placement = self.text_surfaces.pop(text_key, None)
+        if text_placement is None:
+            if len(self.text_surfaces) >= TEXT_SURFACE_CACHE_SIZE:
+                del self.text_surfaces[next(iter(self.text_surfaces))]
+            font: Font = getattr(self.font_assets, font_name)
+            text_surface = font.render(text, True, font_color)
+
+            # Convert position to pixel values
+            pixel_position = (
+                round(position[0] * self.current_screen_size[0]),
+                round(position[1] * self.current_screen_size[1]),
+            )
+            text_placement = (text_surface, text_surface.get_rect(**{positioning: pixel_position}))
+        self.text_surfaces[text_key] = text_placement
+
+        self.screen.blit(*text_placement)
+
+        return text_placement[1]
 
     def render_options_values(
         self,
@@ -331,7 +533,7 @@ class RenderManager:
         position_key = next(iter(position_args))
         base_position = position_args[position_key]
 
-        for i, key in enumerate(option_items):
+        for i, (key, option_item) in enumerate(option_items.items()):
             option_position = {
                 position_key: (
                     base_position[0],
@@ -339,7 +541,7 @@ class RenderManager:
                 )
             }
             self.render_text(
-                f"{option_items[key]['text']}: {option_items[key]['value']}",
+                f"{option_item['text']}: {option_item['value']}",
                 font_name,
                 (highlight_color if key == selected_item_name else option_color),
                 option_position,
@@ -393,7 +595,7 @@ class RenderManager:
         game_state: GameState,
         clock: pygame.time.Clock,
         font_name: str = "small_font",
-    ) -> None:
+    ) -> pygame.Rect | None:
         """Renders the FPS on the screen.
 
         This method displays the current frames per second (FPS) on the screen
@@ -404,17 +606,22 @@ class RenderManager:
             game_state (GameState): Game state object.
             font (Font): Font to use.
             clock (pygame.time.Clock): Pygame clock object.
+
+        Returns:
+            pygame.Rect | None: The area of the FPS text or None if the FPS is not shown.
         """
 
         if game_state.show_fps:
             fps = str(round(clock.get_fps()))
-            self.render_text(
+            return self.render_text(
                 f"FPS: {fps}",
                 font_name,
                 "black",
                 {"topleft": (0.02, 0.02)},
             )
 
+        return None
+
     def render_shop_items(
         self,
         shop_items: list[dict[str, Any]],
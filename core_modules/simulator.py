@@ -10,7 +10,7 @@ with mass preservation and the growth status of the cell is also updated accordi
 from numba import njit
 
 
-@njit
+@njit(cache=True)  # Compiled once and reused by later runs instead of on every start
 def update_nutrient_value(
     nutrient_value: float,
     energy_value: float,
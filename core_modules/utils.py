@@ -6,6 +6,15 @@ from typing import Any
 
 import yaml
 
+HEXAGON_NEIGHBOR_OFFSETS: tuple[tuple[int, int], ...] = (
+    (-1, 0),
+    (-1, 1),
+    (0, -1),
+    (0, 1),
+    (1, -1),
+    (1, 0),
+)
+
 
 def load_config_from_yaml(path: str) -> Any | None:
     """Get configs from a yaml file.
@@ -49,14 +58,7 @@ def calculate_hexagon_neighbors(
 
     r, q = axial_coordinate
 
-    return [
-        (-1 + r, 0 + q),
-        (-1 + r, 1 + q),
-        (0 + r, -1 + q),
-        (0 + r, 1 + q),
-        (1 + r, -1 + q),
-        (1 + r, 0 + q),
-    ]
+    return [(r + r_offset, q + q_offset) for r_offset, q_offset in HEXAGON_NEIGHBOR_OFFSETS]
 
 
 def calculate_axial_distance(a_axial: tuple[int, int], b_axial: tuple[int, int]) -> int:
@@ -70,10 +72,11 @@ def calculate_axial_distance(a_axial: tuple[int, int], b_axial: tuple[int, int])
         int: The distance in hex tiles between the two coordinates.
     """
 
-    a_cube = convert_axial_to_cube(a_axial)
-    b_cube = convert_axial_to_cube(b_axial)
+    # Cube distance without converting to cube coordinates, the sum of the terms is always even
+    r_difference = a_axial[0] - b_axial[0]
+    q_difference = a_axial[1] - b_axial[1]
 
-    return round(calculate_cube_distance(a_cube, b_cube))
+    return (abs(r_difference) + abs(q_difference) + abs(r_difference + q_difference)) // 2
 
 
 def calculate_cube_distance(a: tuple[int, int, int], b: tuple[int, int, int]) -> float:
@@ -65,9 +65,7 @@ class ColonizationPhase:
         hexagon_grid = HexagonGrid(
             game_state, self.render_manager.current_screen_size, grid_center_offset
         )
-        cell_line = CellLine(
-            hexagon_grid, game_state, self.render_manager.current_screen_size, grid_center_offset
-        )
+        cell_line = CellLine(hexagon_grid, game_state)
 
         if self.escape_menu is None:
             self.escape_menu = EscapeMenu(
@@ -79,9 +77,13 @@ class ColonizationPhase:
         self.process_plotter.reset_cache()
         self.plot_surface = self.process_plotter.create_simple_plot(self.process_tracker)
 
-        while True:
-            level_running = False
+        # Totals are kept up to date with the changes of the growing cells instead of summing all
+        # cells and hexagons every frame, replication only splits the energy of a cell
+        total_biomass = cell_line.get_biomass()
+        total_nutrient = hexagon_grid.get_total_nutrient()
 
+        full_update = True
+        while True:
             for event in pygame.event.get():
                 event_handler.handle_quit(event)
 
@@ -89,6 +91,7 @@ class ColonizationPhase:
                     self.process_tracker.pause()
                     result = self.escape_menu.show_escape_menu(game_state)
                     self.process_tracker.resume()
+                    full_update = True  # The escape menu was drawn over the whole screen
 
                     if result == EscapeMenuResult.MAIN_MENU:
                         raise ReturnToMainMenuException()
@@ -96,26 +99,19 @@ class ColonizationPhase:
                         pygame.quit()
                         sys.exit()
 
-            for cell_coordinate, cell in list(
-                cell_line.cells.items()
-            ):  # iterate over a copy of the cell line to avoid modifying it while iterating
-                if cell.growth:
-                    level_running = True
-                    if cell.energy_value >= game_state.cell_division_threshold:
-                        new_cell_coordinate = cell_line.replicate_cell(
-                            cell_coordinate,
-                            hexagon_grid,
-                            game_state,
-                            self.render_manager.current_screen_size,
-                        )
-                        if new_cell_coordinate:
-                            hexagon_grid.hexagons[new_cell_coordinate].set_highlight(50)
-                    cell.update_radius(hexagon_grid.minimal_radius)
-                    hexagon_grid.hexagons[cell_coordinate].update(cell)
-
-            self.process_tracker.update(cell_line, hexagon_grid)
+                if event.type == pygame.WINDOWEXPOSED:
+                    full_update = True
+
+            level_running, biomass_change, nutrient_change = self._update_cells(
+                game_state, hexagon_grid, cell_line
+            )
+            total_biomass += biomass_change
+            total_nutrient += nutrient_change
+
+            self.process_tracker.update(total_biomass, total_nutrient)
             self._update_process_plot()
-            self._render_colonization_phase(game_state, hexagon_grid, cell_line)
+            self._render_colonization_phase(game_state, hexagon_grid, cell_line, full_update)
+            full_update = False
 
             if not level_running:
                 break
@@ -124,7 +120,73 @@ class ColonizationPhase:
         game_state.current_biomass = current_biomass
         game_state.run_biomass += current_biomass
 
+        self._sell_harvest(game_state, hexagon_grid, cell_line)
+
+    def _update_cells(
+        self,
+        game_state: GameState,
+        hexagon_grid: HexagonGrid,
+        cell_line: CellLine,
+    ) -> tuple[bool, float, float]:
+        """Grow and replicate the growing cells for one frame.
+
+        Args:
+            game_state (GameState): The current game state.
+            hexagon_grid (HexagonGrid): The hexagon grid for the game.
+            cell_line (CellLine): The cell line for the game.
+
+        Returns:
+            tuple[bool, float, float]: Whether any cell is still growing, and the changes of the
+                total biomass and the total nutrient.
+        """
+
+        # Values that do not change during the frame, bound once for the per-cell loop
+        division_threshold = game_state.cell_division_threshold
+        minimal_radius = hexagon_grid.minimal_radius
+        replicate_cell = cell_line.replicate_cell
+
+        level_running = False
+        biomass_change = 0.0
+        nutrient_change = 0.0
+        for cell_coordinate, cell in cell_line.cells.items():
+            if cell.growth:
+                level_running = True
+                if cell.energy_value >= division_threshold:
+                    new_cell_coordinate = replicate_cell(
+                        cell_coordinate,
+                        hexagon_grid,
+                        game_state,
+                    )
+                    if new_cell_coordinate:
+                        hexagon_grid.hexagons[new_cell_coordinate].set_highlight(50)
+                cell.update_radius(minimal_radius)
+                hexagon = cell.hexagon
+                biomass_change -= cell.energy_value
+                nutrient_change -= hexagon.nutrient_value
+                hexagon.update(cell)
+                biomass_change += cell.energy_value
+                nutrient_change += hexagon.nutrient_value
+        cell_line.add_new_cells()  # Replicated cells are only added after iterating the cells
+
+        return level_running, biomass_change, nutrient_change
+
+    def _sell_harvest(
+        self,
+        game_state: GameState,
+        hexagon_grid: HexagonGrid,
+        cell_line: CellLine,
+    ) -> None:
+        """Sell the biomass of the level for credits and release the cells and hexagons.
+
+        Args:
+            game_state (GameState): The current game state.
+            hexagon_grid (HexagonGrid): The hexagon grid for the game.
+            cell_line (CellLine): The cell line for the game.
+        """
+
         selling_size = 0.02 * game_state.current_biomass
+        biomass_sold_per_frame = 0.05 + 0.5 * selling_size
+        biomass_price = game_state.biomass_price
         while True:
             for event in pygame.event.get():
                 event_handler.handle_quit(event)
@@ -148,12 +210,14 @@ class ColonizationPhase:
                     self.credits_gained = 0
                     self.selling_completed = False
                     self.selling_initiated = False
+                    cell_line.release_cells()
+                    hexagon_grid.release_hexagons()
                     return
 
             if self.selling_initiated:
-                biomass_sold = min(0.05 + 0.5 * selling_size, game_state.current_biomass)
+                biomass_sold = min(biomass_sold_per_frame, game_state.current_biomass)
                 game_state.current_biomass -= biomass_sold
-                self.credits_gained += biomass_sold * game_state.biomass_price
+                self.credits_gained += biomass_sold * biomass_price
                 if game_state.current_biomass == 0:
                     self.selling_completed = True
 
@@ -174,21 +238,30 @@ class ColonizationPhase:
         self.frame_count += 1
 
     def _render_colonization_phase(
-        self, game_state: GameState, hexagon_grid: HexagonGrid, cell_line: CellLine
+        self,
+        game_state: GameState,
+        hexagon_grid: HexagonGrid,
+        cell_line: CellLine,
+        full_update: bool = True,
     ) -> None:
         """Render the colonization phase of the game.
 
+        Only the reactor with the hexagons and the process plot change during the colonization,
+        so only these areas are updated on the display unless a full update is requested.
+
         Args:
             game_state (GameState): The current game state.
             hexagon_grid (HexagonGrid): The hexagon grid for the game.
             cell_line (CellLine): The cell line for the game.
+            full_update (bool, optional): Whether to update the whole display, e.g. when the
+                screen is shown for the first time. Defaults to True.
         """
 
         self.render_manager.render_background_color("colonization_background")
 
         # Static reactor body
         reactor_center_x = 0.28
-        self.render_manager.render_image(
+        reactor_rect = self.render_manager.render_image(
             image_name="reactor_background",
             position_args={"center": (reactor_center_x, 0.5)},
             size_args=("height", 0.8),
@@ -214,10 +287,14 @@ class ColonizationPhase:
         self.render_manager.render_hexagons(hexagon_grid)
         self.render_manager.render_cells(cell_line)
 
+        plot_rect = None
         if self.plot_surface:
-            self._render_process_plot_sidebar()
+            plot_rect = self._render_process_plot_sidebar()
 
-        self.render_manager.update_screen(game_state, self.clock)
+        dirty_rects = None
+        if not full_update:
+            dirty_rects = [reactor_rect.union(hexagon_grid.get_pixel_bounds()), plot_rect]
+        self.render_manager.update_screen(game_state, self.clock, dirty_rects)
 
     def _render_point_screen(
         self,
@@ -292,13 +369,25 @@ class ColonizationPhase:
         if self.plot_surface:
             self._render_process_plot_sidebar()
 
-        self.render_manager.update_screen(game_state, self.clock)
+        # Only selling is animated, the screen otherwise waits for input
+        waiting_for_input = not self.selling_initiated or self.selling_completed
+        self.render_manager.update_screen(
+            game_state,
+            self.clock,
+            fps_limit=game_state.fps_idle_maximum if waiting_for_input else None,
+        )
 
-    def _render_process_plot_sidebar(self) -> None:
-        """Render the process parameters plot in the right sidebar."""
+    def _render_process_plot_sidebar(self) -> pygame.Rect | None:
+        """Render the process parameters plot in the right sidebar.
+
+        Returns:
+            pygame.Rect | None: The area of the plot with its border or None if there is no plot.
+        """
 
         if not self.plot_surface:
-            return
+            return None
+
+        border_padding = 8
 
         # Use render manager to handle plot rendering with caching
         self.cached_plot_position, self.cached_plot_size, self.plot_surface = (
@@ -309,8 +398,18 @@ class ColonizationPhase:
                 max_width_fraction=0.50,
                 max_height_fraction=0.85,
                 margin=30,
-                border_padding=8,
+                border_padding=border_padding,
                 background_color=(255, 255, 255),
                 border_color=(60, 60, 80),
             )
         )
+
+        plot_x, plot_y = self.cached_plot_position
+        plot_width, plot_height = self.cached_plot_size
+
+        return pygame.Rect(
+            plot_x - border_padding,
+            plot_y - border_padding,
+            plot_width + border_padding * 2,
+            plot_height + border_padding * 2,
+        )
@@ -102,11 +102,10 @@ class EscapeMenu:
             game_state (GameState): The current game state.
         """
 
-        # Render the background hexagon grid (like main menu and settings)
-        self.render_manager.render_hexagons(self.background_hexagon_grid)
-
-        # Add shadow overlay for consistency with main menu and settings
-        self.render_manager.render_shadow_overlay(color="black", alpha=60)
+        # Render the background hexagon grid with shadow overlay (like main menu and settings)
+        self.render_manager.render_background_hexagons(
+            self.background_hexagon_grid, shadow_alpha=60
+        )
 
         # Game is paused header
         self.render_manager.render_text(
@@ -127,4 +126,7 @@ class EscapeMenu:
             option_color="black",
         )
 
-        self.render_manager.update_screen(game_state, self.clock)
+        # The escape menu is static and only waits for input
+        self.render_manager.update_screen(
+            game_state, self.clock, fps_limit=game_state.fps_idle_maximum
+        )
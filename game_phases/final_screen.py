@@ -47,20 +47,31 @@ class FinalScreen:
             player_name,
         )
 
+        full_update = True
         while True:
-            for event in pygame.event.get():
-                event_handler.handle_quit(event)
+            # The final screen is static apart from the FPS, so the whole display is only updated
+            # when it is shown or uncovered
+            self.render_final_screen(
+                game_state, updated_scores, new_high_score_index, None if full_update else []
+            )
+            full_update = False
+
+            # Sleep until input arrives instead of polling, waking up only for the FPS display
+            event = pygame.event.wait(1000 // game_state.fps_idle_maximum)
+            event_handler.handle_quit(event)
 
-                if event_handler.handle_option_selection(event):
-                    return
+            if event_handler.handle_option_selection(event):
+                return
 
-            self.render_final_screen(game_state, updated_scores, new_high_score_index)
+            if event.type == pygame.WINDOWEXPOSED:
+                full_update = True
 
     def render_final_screen(
         self,
         game_state: GameState,
         high_scores: list[dict],
         new_high_score_index: int | None,
+        dirty_rects: list[pygame.Rect] | None = None,
     ) -> None:
         """Renders final score and top highscores for the given number of levels.
 
@@ -68,6 +79,8 @@ class FinalScreen:
             game_state (GameState): The current state of the game.
             high_scores (list[dict]): List of high scores to display.
             new_high_score_index (int | None): Index of the new high score, if any.
+            dirty_rects (list[pygame.Rect] | None, optional): Changed areas of the screen to
+                update on the display. Defaults to None, updating the whole display.
         """
 
         # Background color
@@ -120,4 +133,6 @@ class FinalScreen:
             {"center": (0.5, 0.9)},
         )
 
-        self.render_manager.update_screen(game_state, self.clock)
+        self.render_manager.update_screen(
+            game_state, self.clock, dirty_rects, fps_limit=game_state.fps_idle_maximum
+        )
@@ -14,7 +14,6 @@ from pygame.time import Clock
 from core_modules import event_handler
 from core_modules.game_state import GameState
 from core_modules.hexagon_grid import HexagonGrid
-from core_modules.hexagon_tile import HexagonTile
 from core_modules.player_data_manager import load_player_name, save_player_name
 from core_modules.render_manager import RenderManager
 from game_phases.colonization_phase import ColonizationPhase, ReturnToMainMenuException
@@ -44,10 +43,7 @@ class MainMenu:
         self.render_manager: RenderManager = render_manager
 
         self.hexagon_grid = HexagonGrid(self.game_state, self.render_manager.current_screen_size)
-        self.hexagon_grid._update_size_parameters(
-            self.render_manager.current_screen_size, radius_fraction=15
-        )
-        self.hexagon_grid.hexagons = self._create_background_hexagon_grid()
+        self._update_hexagon_grid_for_new_screen_size()
 
         self.settings_menu: SettingsMenu = SettingsMenu(
             self.clock, self.render_manager, self.hexagon_grid
@@ -89,9 +85,9 @@ class MainMenu:
 
                 if event_handler.handle_option_selection(event):
                     if self.selected_option == 0:  # Start game
-                        self._start_game()
-                        self.run_main_menu()
-                    elif self.selected_option == 1:  # Change Name
+                        self._start_game()  # Returns to this loop after the game
+                        break  # Events from before the game are stale
+                    if self.selected_option == 1:  # Change Name
                         self.player_name = self._prompt_for_name()
                         save_player_name(self.player_name)
                     elif self.selected_option == 2:  # Settings menu
@@ -138,34 +134,6 @@ class MainMenu:
         except (ReturnToMainMenuException, ShopReturnToMainMenuException):
             return
 
-    def _create_background_hexagon_grid(self) -> dict[tuple[int, int], HexagonTile]:
-        """Create a grid of hexagons for the main menu.
-
-        Returns:
-            dict[tuple[int, int], HexagonTile]: Dictionary of hexagons with coordinates as keys.
-        """
-
-        screen_width, screen_height = self.render_manager.current_screen_size
-        number_r_hexagons = round(screen_width / self.hexagon_grid.maximal_radius / 2) + 10
-        number_q_hexagons = round(screen_height / self.hexagon_grid.minimal_radius / 2) + 5
-
-        coordinates = []
-        r_offset = -round(number_r_hexagons / 2)
-        q_offset = -round(number_q_hexagons / 2)
-        for r in range(number_r_hexagons):
-            for q in range(number_q_hexagons):
-                coordinates.append((r_offset + r, q_offset + q))
-
-        hexagons = {}
-        for coordinate in coordinates:
-            hexagons[coordinate] = self.hexagon_grid.create_hexagon(
-                coordinate,
-                self.game_state.hexagon_nutrient_variation,
-                self.game_state.hexagon_nutrient_richness,
-            )
-
-        return hexagons
-
     def _prompt_for_name(self) -> str:
         """Display prompt to enter player name."""
 
@@ -205,7 +173,9 @@ class MainMenu:
                 {"center": (0.5, 0.6)},
             )
 
-            self.render_manager.update_screen(self.game_state, self.clock)
+            self.render_manager.update_screen(
+                self.game_state, self.clock, fps_limit=self.game_state.fps_idle_maximum
+            )
 
         input_name = input_name.strip()
         save_player_name(input_name)
@@ -215,11 +185,8 @@ class MainMenu:
     def _render_main_menu(self) -> None:
         """Render the main menu screen with hexagons and options."""
 
-        # Render the background hexagon grid
-        self.render_manager.render_hexagons(self.hexagon_grid)
-
-        # Render the shadow overlay
-        self.render_manager.render_shadow_overlay(color="black", alpha=60)
+        # Render the background hexagon grid with its shadow overlay
+        self.render_manager.render_background_hexagons(self.hexagon_grid, shadow_alpha=60)
 
         # Title with name of the game
         self.render_manager.render_text(
@@ -254,4 +221,7 @@ class MainMenu:
             {"center": (0.5, 0.85)},
         )
 
-        self.render_manager.update_screen(self.game_state, self.clock)
+        # The main menu is static and only waits for input
+        self.render_manager.update_screen(
+            self.game_state, self.clock, fps_limit=self.game_state.fps_idle_maximum
+        )
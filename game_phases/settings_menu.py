@@ -48,50 +48,66 @@ class SettingsMenu:
             GameState: The updated game state after settings changes.
         """
 
+        # Only key presses, quitting and uncovering the window are handled, so other events are
+        # kept out of the queue
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.WINDOWEXPOSED])
+
+        full_update = True
         while True:
-            for event in pygame.event.get():
-                event_handler.handle_quit(event)
-
-                if self.secondary_option_selected:
-                    if self.selected_option == 0:  # Number of levels
-                        game_state.default_number_levels = (
-                            event_handler.handle_change_option_value_with_circling(
-                                event,
-                                game_state.default_number_levels,
-                                game_state.max_number_levels,
-                                1,  # At least one level is required to be played
-                            )
-                        )
-                    elif self.selected_option == 1:  # Toggle show fps
-                        game_state.show_fps = event_handler.handle_change_bool_option(
-                            event, game_state.show_fps
-                        )
-                    elif self.selected_option == 2:  # Toggle fullscreen
-                        game_state.full_screen = event_handler.handle_change_bool_option(
-                            event, game_state.full_screen
+            # The menu only changes on input, so without input only the FPS display is updated and
+            # nothing is rendered at all while the FPS display is hidden
+            if full_update:
+                self._render_settings(game_state)
+            elif game_state.show_fps:
+                self._render_settings(game_state, [])
+
+            # The settings menu only changes on input, so it sleeps until input arrives instead of
+            # polling, waking up at the idle frame rate for the FPS display
+            event = pygame.event.wait(1000 // game_state.fps_idle_maximum)
+            event_handler.handle_quit(event)
+            full_update = event.type != pygame.NOEVENT
+
+            if self.secondary_option_selected:
+                if self.selected_option == 0:  # Number of levels
+                    game_state.default_number_levels = (
+                        event_handler.handle_change_option_value_with_circling(
+                            event,
+                            game_state.default_number_levels,
+                            game_state.max_number_levels,
+                            1,  # At least one level is required to be played
                         )
-                        self.full_screen_toggled = event_handler.handle_change_bool_option(
-                            event, self.full_screen_toggled
-                        )
-
-                else:
-                    self.selected_option = event_handler.handle_option_navigation(
-                        event, self.selected_option, len(self.menu_options)
                     )
-                    if self.full_screen_toggled:
-                        self.render_manager.toggle_full_screen(game_state.full_screen)
-                        self.hexagon_grid.recreate_background_hexagon_grid(
-                            game_state, self.render_manager.current_screen_size, radius_fraction=15
-                        )
-                        self.full_screen_toggled = False
-                    if event_handler.handle_escape(event):
-                        return game_state
+                elif self.selected_option == 1:  # Toggle show fps
+                    game_state.show_fps = event_handler.handle_change_bool_option(
+                        event, game_state.show_fps
+                    )
+                elif self.selected_option == 2:  # Toggle fullscreen
+                    game_state.full_screen = event_handler.handle_change_bool_option(
+                        event, game_state.full_screen
+                    )
+                    self.full_screen_toggled = event_handler.handle_change_bool_option(
+                        event, self.full_screen_toggled
+                    )
 
-                self.secondary_option_selected = event_handler.handle_secondary_option_selection(
-                    event, self.secondary_option_selected
+            else:
+                self.selected_option = event_handler.handle_option_navigation(
+                    event, self.selected_option, len(self.menu_options)
                 )
-
-            self._render_settings(game_state)
+                if self.full_screen_toggled:
+                    self.render_manager.toggle_full_screen(game_state.full_screen)
+                    self.hexagon_grid.recreate_background_hexagon_grid(
+                        game_state, self.render_manager.current_screen_size, radius_fraction=15
+                    )
+                    self.full_screen_toggled = False
+                if event_handler.handle_escape(event):
+                    pygame.event.set_allowed(None)
+                    event_handler.block_unused_events()
+                    return game_state
+
+            self.secondary_option_selected = event_handler.handle_secondary_option_selection(
+                event, self.secondary_option_selected
+            )
 
     def _render_menu_options(self, option_values: list) -> None:
         """Helper method to render menu options and their values.
@@ -102,77 +118,54 @@ class SettingsMenu:
 
         option_distance = 0.075
 
+        # The selected option is highlighted in the labels or, while changing it, in the values
         if self.secondary_option_selected:
-            self.render_manager.render_options(
-                self.menu_options,
-                None,
-                "title_font",
-                {
-                    "topleft": (
-                        0.1,
-                        0.25,
-                    )
-                },
-                distance_between_options=option_distance,
-                highlight_color="white",
-                option_color="black",
-            )
-            self.render_manager.render_options(
-                option_values,
-                self.selected_option,
-                "title_font",
-                {
-                    "topright": (
-                        0.9,
-                        0.25,
-                    )
-                },
-                distance_between_options=option_distance,
-                highlight_color="white",
-                option_color="black",
-            )
+            selected_label, selected_value = None, self.selected_option
         else:
-            self.render_manager.render_options(
-                self.menu_options,
-                self.selected_option,
-                "title_font",
-                {
-                    "topleft": (
-                        0.1,
-                        0.25,
-                    )
-                },
-                distance_between_options=option_distance,
-                highlight_color="white",
-                option_color="black",
-            )
-            self.render_manager.render_options(
-                option_values,
-                None,
-                "title_font",
-                {
-                    "topright": (
-                        0.9,
-                        0.25,
-                    )
-                },
-                distance_between_options=option_distance,
-                highlight_color="white",
-                option_color="black",
-            )
+            selected_label, selected_value = self.selected_option, None
 
-    def _render_settings(self, game_state: GameState) -> None:
+        self.render_manager.render_options(
+            self.menu_options,
+            selected_label,
+            "title_font",
+            {
+                "topleft": (
+                    0.1,
+                    0.25,
+                )
+            },
+            distance_between_options=option_distance,
+            highlight_color="white",
+            option_color="black",
+        )
+        self.render_manager.render_options(
+            option_values,
+            selected_value,
+            "title_font",
+            {
+                "topright": (
+                    0.9,
+                    0.25,
+                )
+            },
+            distance_between_options=option_distance,
+            highlight_color="white",
+            option_color="black",
+        )
+
+    def _render_settings(
+        self, game_state: GameState, dirty_rects: list[pygame.Rect] | None = None
+    ) -> None:
         """Renders the settings menu.
 
         Args:
             game_state (GameState): The current game state.
+            dirty_rects (list[pygame.Rect] | None, optional): Changed areas of the screen to
+                update on the display. Defaults to None, updating the whole display.
         """
 
-        # Background hexagons
-        self.render_manager.render_hexagons(self.hexagon_grid)
-
-        # Shadow overlay
-        self.render_manager.render_shadow_overlay(color="black", alpha=60)
+        # Background hexagons with shadow overlay
+        self.render_manager.render_background_hexagons(self.hexagon_grid, shadow_alpha=60)
 
         # Title
         self.render_manager.render_text(
@@ -197,4 +190,6 @@ class SettingsMenu:
         # Menu options and their values
         self._render_menu_options(settings_menu_option_values)
 
-        self.render_manager.update_screen(game_state, self.clock)
+        self.render_manager.update_screen(
+            game_state, self.clock, dirty_rects, fps_limit=game_state.fps_idle_maximum
+        )
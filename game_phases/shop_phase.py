@@ -70,6 +70,9 @@ class ShopPhase:
                 self.clock, self.render_manager, self.background_hexagon_grid
             )
 
+        # Statistics only change when an item is bought
+        current_statistics = self._get_current_statistics(game_state)
+
         while True:
             for event in pygame.event.get():
                 event_handler.handle_quit(event)
@@ -96,8 +99,9 @@ class ShopPhase:
                         game_state, items_list = self._buy_item(
                             self.selected_option - 1, items_list, game_state
                         )
+                        current_statistics = self._get_current_statistics(game_state)
 
-            self._render_shop_phase(game_state, items_list)
+            self._render_shop_phase(game_state, items_list, current_statistics)
 
     def _load_item_stats(self) -> list[dict[str, Any]]:
         """Loads item statistics from a YAML file.
@@ -182,8 +186,8 @@ class ShopPhase:
         )
 
         rarity_adjusted_items = []
-        for item in random_items:
-            item["rarity"] = random_items_rarities[random_items.index(item)]
+        for item, rarity in zip(random_items, random_items_rarities):
+            item["rarity"] = rarity
             item["modification_value"] = item["default_modification_value"] * (item["rarity"] + 1)
             item["price"] = round(item["default_price"] * 3 * (item["rarity"] + 1))
             rarity_adjusted_items.append(item)
@@ -232,52 +236,18 @@ class ShopPhase:
                 return "yellow"
             return "red"
 
-    def _render_shop_phase(self, game_state: GameState, items_list: list[dict[str, Any]]) -> None:
-        """Renders the shop phase.
+    def _get_current_statistics(self, game_state: GameState) -> dict[str, dict[str, Any]]:
+        """Gets the current reactor and cell statistics shown in the shop.
 
         Args:
             game_state (GameState): Game state object.
-            items_list (list[dict[str, Any]]): List of items in the shop.
-        """
-
-        # Background
-        self.render_manager.render_background_color("white")
-
-        # Reactor background image
-        self.render_manager.render_image(
-            image_name="reactor_background",
-            position_args={"center": (0.5, 0.5)},
-            size_args=("height", 0.9),
-        )
-
-        # Reactor stirrer animation
-        self.render_manager.render_image_animation(
-            image_name="reactor_stirrer",
-            images_per_second=game_state.fps_maximum // 4,
-            position_args={"center": (0.5, 0.5)},
-            size_args=("height", 0.9),
-        )
 
-        # Reactor liquid animation
-        self.render_manager.render_image_animation(
-            image_name="reactor_liquid",
-            images_per_second=game_state.fps_maximum // 8,
-            position_args={"center": (0.5, 0.5)},
-            size_args=("height", 0.9),
-        )
-
-        # Shadow overlay
-        self.render_manager.render_shadow_overlay(alpha=140)
-
-        # Shop stats display computer image
-        self.render_manager.render_image(
-            image_name="shop_computer_image",
-            position_args={"bottomleft": (0, 1)},
-            size_args=("height", 0.72),
-        )
+        Returns:
+            dict[str, dict[str, Any]]: Statistics by game state variable name with their display
+                text and rounded value.
+        """
 
-        # Gather statistics
-        current_statistics = {
+        return {
             "biomass_price": {
                 "text": "Biomass price",
                 "value": round(game_state.biomass_price, 3),
@@ -316,6 +286,56 @@ class ShopPhase:
             },
         }
 
+    def _render_shop_phase(
+        self,
+        game_state: GameState,
+        items_list: list[dict[str, Any]],
+        current_statistics: dict[str, dict[str, Any]],
+    ) -> None:
+        """Renders the shop phase.
+
+        Args:
+            game_state (GameState): Game state object.
+            items_list (list[dict[str, Any]]): List of items in the shop.
+            current_statistics (dict[str, dict[str, Any]]): Current statistics to display.
+        """
+
+        # Background
+        self.render_manager.render_background_color("white")
+
+        # Reactor background image
+        self.render_manager.render_image(
+            image_name="reactor_background",
+            position_args={"center": (0.5, 0.5)},
+            size_args=("height", 0.9),
+        )
+
+        # Reactor stirrer animation
+        self.render_manager.render_image_animation(
+            image_name="reactor_stirrer",
+            images_per_second=game_state.fps_maximum // 4,
+            position_args={"center": (0.5, 0.5)},
+            size_args=("height", 0.9),
+        )
+
+        # Reactor liquid animation
+        self.render_manager.render_image_animation(
+            image_name="reactor_liquid",
+            images_per_second=game_state.fps_maximum // 8,
+            position_args={"center": (0.5, 0.5)},
+            size_args=("height", 0.9),
+        )
+
+        # Shadow overlay
+        self.render_manager.render_shadow_overlay(alpha=140)
+
+        # Shop stats display computer image
+        self.render_manager.render_image(
+            image_name="shop_computer_image",
+            position_args={"bottomleft": (0, 1)},
+            size_args=("height", 0.72),
+        )
+
         selected_item_index = self.selected_option - 1
         if self.selected_option != 0:
             item_variable_name = items_list[selected_item_index]["variable_name"]
@@ -24,6 +24,7 @@ Author: Luis Seibert
 import pygame
 from pygame.time import Clock
 
+from core_modules import event_handler
 from core_modules.game_state import GameState
 from core_modules.render_manager import RenderManager
 from game_phases.main_menu import MainMenu
@@ -51,6 +52,7 @@ def run_game() -> None:
 
     pygame.init()
     pygame.display.set_caption("CytoGenesis")
+    event_handler.block_unused_events()
 
     clock: Clock = pygame.time.Clock()
     game_state = GameState()